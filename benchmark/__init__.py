@@ -0,0 +1,12 @@
+from time import perf_counter
+
+
+def best_of(function, repeat=3):
+    # Runs "function" "repeat" times and returns the fastest wall-clock time in seconds
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
@@ -0,0 +1,24 @@
+"""Throughput of romanise_many compared to a loop of single romanise calls.
+
+Usage: python -m benchmark.batch [word count]
+"""
+import sys
+
+from ko_pron import romanise, romanise_many
+from ko_pron.ko_pron import system_lookup
+
+from . import best_of
+from .corpus import random_words
+
+
+def main(count=20000):
+    words = random_words(count)
+    print("{:<5} {:>14} {:>14} {:>8}".format("sys", "loop words/s", "batch words/s", "speedup"))
+    for system in system_lookup:
+        loop = best_of(lambda: [romanise(word, system) for word in words])
+        batch = best_of(lambda: romanise_many(words, system))
+        print("{:<5} {:>14.0f} {:>14.0f} {:>7.2f}x".format(system, count / loop, count / batch, loop / batch))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,55 @@
+from random import Random
+
+HANGUL_FIRST, HANGUL_COUNT = 0xAC00, 11172
+
+
+def random_syllable(rnd: Random):
+    return chr(HANGUL_FIRST + rnd.randrange(HANGUL_COUNT))
+
+
+def random_words(count: int, seed: int = 0, min_length: int = 1, max_length: int = 5):
+    # Deterministic list of "count" words made of random precomposed Hangul syllables
+    rnd = Random(seed)
+    return ["".join(random_syllable(rnd) for _ in range(rnd.randint(min_length, max_length)))
+            for _ in range(count)]
+
+
+def mixed_text(size: int, seed: int = 0):
+    # Deterministic sentences of Hangul words mixed with Latin words and punctuation, "size" UTF-8 bytes long
+    rnd = Random(seed)
+    latin = ["Seoul", "KTX", "2024", "(note)", "e.g.", "OK"]
+    pieces, length = [], 0
+    while length < size:
+        piece = rnd.choice(latin) if rnd.random() < 0.2 else \
+            "".join(random_syllable(rnd) for _ in range(rnd.randint(1, 4)))
+        piece += rnd.choice([" ", " ", " ", ", ", ". "])
+        pieces.append(piece)
+        length += len(piece.encode("utf-8"))
+    return "".join(pieces).encode("utf-8")[:size].decode("utf-8", "ignore")
+
+
+# syllables with respelling variants, 넓/밟 and palatalisation, drawn more often by option_cases
+special_syllables = "외괴쇠계폐위귀쉬뛰어의희넓밟같굳이히"
+
+
+def option_cases(count: int, seed: int = 0, min_length: int = 2, max_length: int = 6):
+    # Deterministic (word, options) pairs exercising l, com, nn, ni, bcred and the respelling parameters.
+    # Only combinations romanise accepts for every system are generated (no cap, nobc before the last syllable).
+    rnd = Random(seed)
+    cases = []
+    for _ in range(count):
+        word = "".join(rnd.choice(special_syllables) if rnd.random() < 0.5 else random_syllable(rnd)
+                       for _ in range(rnd.randint(min_length, max_length)))
+        options = {}
+        for name in ("ui", "ui_e", "svar", "iot", "yeored"):
+            if rnd.random() < 0.3:
+                options[name] = rnd.randrange(len(word))
+        if len(word) > 1 and rnd.random() < 0.3:
+            options["nobc"] = rnd.randrange(len(word) - 1)
+        for name in ("l", "com", "nn", "ni"):
+            if rnd.random() < 0.4:
+                options[name] = rnd.sample(range(-1, len(word)), 2)
+        if rnd.random() < 0.3:
+            options["bcred"] = rnd.randrange(-1, len(word))
+        cases.append((word, options))
+    return cases
@@ -0,0 +1,82 @@
+"""Micro-benchmarks of the per-word helpers of ko_pron.ko_pron, with an optional regression gate.
+
+Results can be saved as a JSON baseline and later runs compared against it; the run fails when a helper
+gets slower per word by more than the tolerance.
+
+Usage: python -m benchmark.helpers [word count] [--save baseline.json] [--compare baseline.json] [--tolerance 0.2]
+"""
+import argparse
+import json
+import sys
+import unicodedata
+
+from ko_pron import ko_pron
+
+from . import best_of
+from .corpus import random_words
+
+
+def cases(words):
+    # name -> function running the helper over all "words"
+    options = ko_pron._normalise_options()
+    l, cap, com, nn, ui, ui_e, nobc, ni, bcred, svar, iot, yeored, max_variants = options
+    fragments = {word: ko_pron._romanise_respelling(word, range(6), l, cap, com, nn, ni, bcred) for word in words}
+    phonetic = {word: unicodedata.normalize('NFC', "".join(fragments[word][0])) for word in words}
+    ipa = {word: "".join(fragments[word][5]) for word in words}
+    joined = {word: {system_index: "".join(fragments[word][system_index]) for system_index in range(6)}
+              for word in words}
+    result = {
+        "decompose_syllable": lambda: [ko_pron.decompose_syllable(word) for word in words],
+        "_respellings": lambda: [list(ko_pron._respellings(word, {}, 5, None, None, None, None, None, None))
+                                 for word in words],
+        "tidy_phonetic": lambda: [ko_pron.tidy_phonetic(word, phonetic[word]) for word in words],
+        "tidy_ipa": lambda: [ko_pron.tidy_ipa(ipa[word]) for word in words],
+    }
+    for system_index, system in enumerate(ko_pron.system_lookup):
+        result["_romanise_respelling " + system] = \
+            lambda system_index=system_index: [ko_pron._romanise_respelling(word, (system_index,), l, cap, com, nn,
+                                                                            ni, bcred) for word in words]
+        result["_finish_romanisation " + system] = \
+            lambda system_index=system_index: [ko_pron._finish_romanisation(word, joined[word][system_index],
+                                                                            system_index, cap) for word in words]
+    return result
+
+
+def run(count=5000):
+    # Returns the mean time per word in nanoseconds of every helper
+    words = random_words(count, seed=1)
+    return {name: best_of(function) / count * 1e9 for name, function in cases(words).items()}
+
+
+def compare(results, baseline, tolerance: float = 0.2):
+    # Returns a description of every helper of "results" that got slower than in "baseline"
+    return ["{}: {:.0f} ns/word, baseline {:.0f}".format(name, nanoseconds, baseline[name])
+            for name, nanoseconds in results.items()
+            if name in baseline and nanoseconds > baseline[name] * (1 + tolerance)]
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmark.helpers")
+    parser.add_argument("count", nargs="?", type=int, default=5000, help="number of random words")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    args = parser.parse_args(arguments)
+
+    results = run(args.count)
+    for name, nanoseconds in results.items():
+        print("{:<30} {:>8.0f} ns/word".format(name, nanoseconds))
+    if args.save:
+        with open(args.save, "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as source:
+            regressions = compare(results, json.load(source), args.tolerance)
+        for regression in regressions:
+            print("regression:", regression)
+        return regressions and 1 or 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
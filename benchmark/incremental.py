@@ -0,0 +1,36 @@
+"""Typing a text one character at a time: IncrementalRomaniser against romanise on the whole buffer.
+
+Usage: python -m benchmark.incremental [text size in bytes]
+"""
+import sys
+
+from ko_pron import romanise
+from ko_pron.incremental import IncrementalRomaniser
+
+from . import best_of
+from .corpus import mixed_text
+
+
+def type_with_romanise(text, system):
+    for end in range(1, len(text) + 1):
+        romanise(text[:end], system)
+
+
+def type_incrementally(text, system):
+    romaniser = IncrementalRomaniser(system)
+    for character in text:
+        romaniser.append(character)
+
+
+def main(size=2000):
+    text = mixed_text(size)
+    print("{} keystrokes".format(len(text)))
+    for system in ["rr", "ipa"]:
+        full = best_of(lambda: type_with_romanise(text, system), repeat=1)
+        incremental = best_of(lambda: type_incrementally(text, system), repeat=1)
+        print("{:<4} romanise {:>8.1f} us/key, incremental {:>6.1f} us/key".format(
+            system, full / len(text) * 1e6, incremental / len(text) * 1e6))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
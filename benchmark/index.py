@@ -0,0 +1,38 @@
+"""Build, size and lookup speed of the reverse romanisation index.
+
+Usage: python -m benchmark.index [word count]
+"""
+import os
+import sys
+import tempfile
+
+from ko_pron import romanise
+from ko_pron.index import ReverseIndex
+
+from . import best_of
+from .corpus import random_words
+
+
+def main(count=20000):
+    words = random_words(count, seed=8, min_length=1, max_length=4)
+    build = best_of(lambda: ReverseIndex.build(words, ["rr", "mr"]), repeat=1)
+    index = ReverseIndex.build(words, ["rr", "mr"])
+    queries = [romanise(word, "rr") for word in words[:2000]]
+    exact = best_of(lambda: [index.lookup(query) for query in queries])
+    prefixes = best_of(lambda: [index.prefix(query[:3], limit=10) for query in queries])
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "index.json.gz")
+        index.save(path)
+        size = os.path.getsize(path)
+        load = best_of(lambda: ReverseIndex.load(path))
+    print("words:          {:>10}".format(count))
+    print("keys:           {:>10}".format(len(index)))
+    print("build:          {:>10.0f} words/s".format(count / build))
+    print("saved size:     {:>10.0f} KB".format(size / 1024))
+    print("load:           {:>10.1f} ms".format(load * 1000))
+    print("exact lookup:   {:>10.1f} µs".format(exact / len(queries) * 1e6))
+    print("prefix lookup:  {:>10.1f} µs (3 letters, 10 results)".format(prefixes / len(queries) * 1e6))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
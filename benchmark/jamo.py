@@ -0,0 +1,44 @@
+"""Per-character cost of the syllable decomposition, and throughput of the bulk conversions on a large text.
+
+Usage: python -m benchmark.jamo [character count] [bulk text size in bytes]
+"""
+import sys
+import unicodedata
+
+from ko_pron import decompose_jamo, decompose_text, compose_text
+from ko_pron.jamo import decompose, decompose_array
+
+from . import best_of
+from .corpus import random_words, mixed_text
+
+
+def main(count=100000, size=8000000):
+    text = "".join(random_words(count, min_length=1, max_length=1))
+    for name, function in [("decompose_jamo (dict)", decompose_jamo), ("jamo.decompose (tuple)", decompose)]:
+        elapsed = best_of(lambda: [function(character) for character in text])
+        print("{:<24} {:>6.0f} ns/char".format(name, elapsed / count * 1e9))
+    try:
+        words = random_words(count // 3)
+        syllables = sum(map(len, words))
+        elapsed = best_of(lambda: decompose_array(words))
+        print("{:<24} {:>6.0f} ns/char".format("decompose_array (numpy)", elapsed / syllables * 1e9))
+    except ImportError as error:
+        print(error)
+
+    # whole strings; NFD and NFC are the C implementations of the same conversions for Hangul, but they also
+    # rewrite other scripts
+    text = mixed_text(size, seed=25)
+    jamo = decompose_text(text)
+    print("\n{} characters of mixed text, {} after decomposition".format(len(text), len(jamo)))
+    per_character = lambda text: "".join(["".join(decompose(character)) for character in text])
+    for name, function, argument in [("decompose per character", per_character, text),
+                                     ("decompose_text", decompose_text, text),
+                                     ("unicodedata NFD", lambda text: unicodedata.normalize("NFD", text), text),
+                                     ("compose_text", compose_text, jamo),
+                                     ("unicodedata NFC", lambda text: unicodedata.normalize("NFC", text), jamo)]:
+        elapsed = best_of(lambda: function(argument))
+        print("{:<24} {:>6.1f} M chars/s".format(name, len(argument) / elapsed / 1e6))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""Hit ratio and speed of the junction cache on a list of common words and on random syllables.
+
+Usage: python -m benchmark.junction_cache [capacity]
+"""
+import os
+import sys
+
+from ko_pron import romanise, set_junction_cache_size, junction_cache_info
+from ko_pron.ko_pron import system_lookup
+
+from . import best_of
+from .corpus import random_words
+
+word_list = os.path.join(os.path.dirname(__file__), "words.txt")
+
+
+def common_words():
+    with open(word_list, encoding="utf-8") as source:
+        return [line.strip() for line in source if line.strip()]
+
+
+def measure(words, capacity):
+    # Returns the hit ratio of one pass over "words" from an empty cache, and the seconds per pass without
+    # the cache and with a warm one
+    def romanise_words():
+        return [romanise(word, system) for word in words for system in system_lookup]
+
+    set_junction_cache_size(None)
+    uncached = best_of(romanise_words)
+    set_junction_cache_size(capacity)
+    romanise_words()
+    info = junction_cache_info()
+    cached = best_of(romanise_words)
+    set_junction_cache_size(None)
+    return info.hits / (info.hits + info.misses), uncached, cached
+
+
+def main(capacity=65536):
+    print("{:>8} {:>6} {:>10} {:>12} {:>12} {:>8}".format("corpus", "words", "hit ratio", "uncached w/s",
+                                                         "cached w/s", "speedup"))
+    for name, words in (("common", common_words()), ("random", random_words(2000, seed=24))):
+        hit_ratio, uncached, cached = measure(words, capacity)
+        print("{:>8} {:>6} {:>9.1%} {:>12.0f} {:>12.0f} {:>7.2f}x".format(name, len(words), hit_ratio,
+                                                                       len(words) / uncached, len(words) / cached,
+                                                                       uncached / cached))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
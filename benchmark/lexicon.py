@@ -0,0 +1,38 @@
+"""Size, open time and lookup speed of a prebuilt lexicon compared to romanise.
+
+Usage: python -m benchmark.lexicon [word count]
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from ko_pron import romanise
+from ko_pron.lexicon import build_lexicon, Lexicon
+
+from . import best_of
+from .corpus import random_words
+
+
+def main(count=100000):
+    words = random_words(count, seed=10)
+    queries = words[:20000]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "words.lex")
+        start = perf_counter()
+        written = build_lexicon(words, path, ["rr", "mr", "ipa"])
+        build = perf_counter() - start
+        open_time = best_of(lambda: Lexicon(path).close())
+        with Lexicon(path) as lexicon:
+            hit = best_of(lambda: [lexicon.lookup(word, "ipa") for word in queries])
+        live = best_of(lambda: [romanise(word, "ipa") for word in queries])
+        print("words:        {:>10}".format(written))
+        print("file size:    {:>10.0f} KB".format(os.path.getsize(path) / 1024))
+        print("build:        {:>10.0f} words/s (3 systems)".format(written / build))
+        print("open:         {:>10.3f} ms".format(open_time * 1000))
+        print("lookup:       {:>10.1f} µs".format(hit / len(queries) * 1e6))
+        print("romanise ipa: {:>10.1f} µs".format(live / len(queries) * 1e6))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,38 @@
+"""Allocations of syllable decomposition and romanisation: tracemalloc peak and garbage collections.
+
+Usage: python -m benchmark.memory [word count]
+"""
+import gc
+import sys
+import tracemalloc
+
+from ko_pron import romanise_many
+from ko_pron.ko_pron import decompose_syllable
+
+from . import best_of
+from .corpus import random_words
+
+
+def traced(function):
+    # Returns the tracemalloc peak in KB and the number of generation 0 collections while "function" runs
+    collections = gc.get_stats()[0]["collections"]
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024, gc.get_stats()[0]["collections"] - collections
+
+
+def main(count=5000):
+    words = random_words(count, seed=6)
+    text = "".join(words)
+    print("{:<26} {:>10} {:>12} {:>10}".format("", "peak KB", "gc gen0", "ms"))
+    for name, function in [("decompose_syllable", lambda: decompose_syllable(text)),
+                           ("romanise_many rr", lambda: romanise_many(words, "rr")),
+                           ("romanise_many ipa", lambda: romanise_many(words, "ipa"))]:
+        peak, collections = traced(function)
+        print("{:<26} {:>10.1f} {:>12} {:>10.1f}".format(name, peak, collections, best_of(function) * 1000))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
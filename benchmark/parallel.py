@@ -0,0 +1,26 @@
+"""Scaling of romanise_many over worker processes.
+
+Usage: python -m benchmark.parallel [word count] [chunk size]
+"""
+import os
+import sys
+
+from ko_pron import romanise_many
+
+from . import best_of
+from .corpus import random_words
+
+
+def main(count=50000, chunk_size=1000):
+    words = random_words(count)
+    print("{} CPUs, {} words, chunks of {}".format(os.cpu_count(), count, chunk_size))
+    print("{:>7} {:>12} {:>8}".format("workers", "words/s", "scaling"))
+    single = None
+    for workers in [1, 2, 4, 8, 16]:
+        elapsed = best_of(lambda: romanise_many(words, "rr", workers=workers, chunk_size=chunk_size), repeat=1)
+        single = single or elapsed
+        print("{:>7} {:>12.0f} {:>7.2f}x".format(workers, count / elapsed, single / elapsed))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
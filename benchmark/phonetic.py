@@ -0,0 +1,34 @@
+"""Speed of tidy_phonetic and of romanise "ph" on long phonetic Hangul strings, with and without l markers.
+
+Usage: python -m benchmark.phonetic [syllable count]
+"""
+import sys
+import unicodedata
+
+from ko_pron import romanise
+from ko_pron.ko_pron import tidy_phonetic, _romanise_respelling
+
+from . import best_of
+from .corpus import random_words
+
+
+def main(syllables=2000):
+    text = ""
+    for word in random_words(syllables, seed=5, min_length=2, max_length=6):
+        if len(text) >= syllables:
+            break
+        text = text and text + " " + word or word
+    print("{:>10} {:>8} {:>18} {:>16}".format("l markers", "chars", "tidy_phonetic ns/c", "romanise ph c/s"))
+    for step in (0, 3, 1):
+        long_vowels = frozenset(range(0, len(text), step)) if step else frozenset()
+        phonetic = "".join(_romanise_respelling(text, (0,), long_vowels, False, frozenset(), frozenset(),
+                                                frozenset(), None)[0])
+        phonetic = unicodedata.normalize('NFC', phonetic)
+        tidy = best_of(lambda: tidy_phonetic(text, phonetic))
+        full = best_of(lambda: romanise(text, "ph", l=sorted(long_vowels)))
+        print("{:>10} {:>8} {:>18.0f} {:>16.0f}".format(len(long_vowels), len(phonetic),
+                                                         tidy / len(phonetic) * 1e9, len(text) / full))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
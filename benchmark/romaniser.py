@@ -0,0 +1,26 @@
+"""Speed of a Romaniser built once per system compared to romanise.
+
+Usage: python -m benchmark.romaniser [word count]
+"""
+import sys
+
+from ko_pron import romanise, Romaniser
+from ko_pron.ko_pron import system_lookup
+
+from . import best_of
+from .corpus import random_words
+
+
+def main(count=5000):
+    words = random_words(count, seed=9)
+    print("{:>6} {:>14} {:>15} {:>8}".format("system", "romanise w/s", "Romaniser w/s", "speedup"))
+    for system in system_lookup:
+        romaniser = Romaniser(system)
+        general = best_of(lambda: [romanise(word, system) for word in words])
+        specialised = best_of(lambda: [romaniser(word) for word in words])
+        print("{:>6} {:>14.0f} {:>15.0f} {:>7.2f}x".format(system, count / general, count / specialised,
+                                                           general / specialised))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
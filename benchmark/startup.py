@@ -0,0 +1,55 @@
+"""Import time of ko_pron from -X importtime, with a pass/fail budget.
+
+"import ko_pron" runs in fresh interpreters with compiled bytecode; the median cumulative time of ko_pron
+is compared to the budget and the slowest modules it imports are listed.
+
+Usage: python -m benchmark.startup [--budget 50] [--repeat 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from statistics import median
+
+package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_profile(code, cache_prefix):
+    # Returns the -X importtime cumulative microseconds of every module imported by "code"
+    environment = dict(os.environ, PYTHONPYCACHEPREFIX=cache_prefix, PYTHONPATH=package_root)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], env=environment,
+                               capture_output=True, text=True, check=True)
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "cumulative" not in line:
+            _, total, name = line.split("|")
+            cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+def measure(repeat: int = 5):
+    # Returns the median profile of "import ko_pron" by module, in milliseconds; the first import only
+    # writes the bytecode
+    with tempfile.TemporaryDirectory() as cache_prefix:
+        import_profile("import ko_pron", cache_prefix)
+        profiles = [import_profile("import ko_pron", cache_prefix) for _ in range(repeat)]
+    return {name: median(profile.get(name, 0) for profile in profiles) / 1000 for name in profiles[0]}
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmark.startup")
+    parser.add_argument("--budget", type=float, default=50, help="milliseconds allowed for import ko_pron")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters, the median is kept")
+    args = parser.parse_args(arguments)
+
+    milliseconds = measure(args.repeat)
+    for name, elapsed in sorted(milliseconds.items(), key=lambda item: -item[1])[:10]:
+        print("{:<30} {:>8.1f} ms".format(name, elapsed))
+    print("import ko_pron: {:.1f} ms, budget {:.0f} ms".format(milliseconds["ko_pron"], args.budget))
+    return milliseconds["ko_pron"] > args.budget and 1 or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
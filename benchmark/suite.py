@@ -0,0 +1,123 @@
+"""Timing of every romanisation system on deterministic corpora, with an optional regression gate.
+
+For each corpus and system it reports syllables/s, the p50 and p99 latency of one romanise call and the
+peak memory allocated while romanising the corpus. Results can be saved as a JSON baseline and later runs
+compared against it; the run fails when the median throughput drops or peak memory grows by more than the
+tolerance. Memory growth below an absolute floor is ignored, tracemalloc peaks of small corpora jitter by a few KB.
+
+Usage: python -m benchmark.suite [--systems rr ipa] [--corpora words text options] [--scale 1.0] [--repeat 5]
+                                 [--save baseline.json] [--compare baseline.json] [--tolerance 0.2]
+                                 [--memory-floor 64]
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+from statistics import median
+from time import perf_counter
+
+from ko_pron import romanise
+from ko_pron.instrumentation import percentile
+from ko_pron.ko_pron import system_lookup
+
+from .corpus import HANGUL_FIRST, HANGUL_COUNT, random_words, mixed_text, option_cases
+
+
+def corpora(scale: float = 1.0):
+    # Lists of (text, options) romanised one call at a time
+    sentences = [sentence for sentence in mixed_text(int(100000 * scale), seed=1).split(". ") if sentence]
+    return {
+        "words": [(word, {}) for word in random_words(int(5000 * scale), seed=1)],
+        "text": [(sentence, {}) for sentence in sentences],
+        "options": option_cases(int(2000 * scale), seed=1),
+    }
+
+
+def syllable_count(cases):
+    return sum(1 for text, _ in cases for character in text if 0 <= ord(character) - HANGUL_FIRST < HANGUL_COUNT)
+
+
+def measure(cases, system: str, repeat: int = 5):
+    # Times every call "repeat" times and keeps the median pass and the median latency of every call;
+    # memory is traced in separate passes and the median peak is kept
+    passes = []
+    for _ in range(repeat):
+        latencies = []
+        for text, options in cases:
+            start = perf_counter()
+            romanise(text, system, **options)
+            latencies.append(perf_counter() - start)
+        passes.append(latencies)
+    peaks = []
+    for _ in range(min(repeat, 3)):
+        tracemalloc.start()
+        for text, options in cases:
+            romanise(text, system, **options)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    latencies = sorted(median(call) for call in zip(*passes))
+    return {"syllables_per_second": round(syllable_count(cases) / median(sum(latencies) for latencies in passes)),
+            "p50_us": round(percentile(latencies, 0.5) * 1e6, 1),
+            "p99_us": round(percentile(latencies, 0.99) * 1e6, 1),
+            "peak_kb": round(median(peaks) / 1024, 1)}
+
+
+def run(systems=system_lookup, names=None, scale: float = 1.0, repeat: int = 5):
+    # Returns {corpus: {system: measurements}}
+    cases = corpora(scale)
+    return {name: {system: measure(cases[name], system, repeat) for system in systems}
+            for name in (names or cases)}
+
+
+def compare(results, baseline, tolerance: float = 0.2, memory_floor_kb: float = 64):
+    # Returns a description of every measurement of "results" that regressed against "baseline";
+    # peak memory only regresses when it grows by more than the tolerance and by more than "memory_floor_kb"
+    regressions = []
+    for name, systems in results.items():
+        for system, measured in systems.items():
+            expected = baseline.get(name, {}).get(system)
+            if expected is None:
+                continue
+            if measured["syllables_per_second"] < expected["syllables_per_second"] * (1 - tolerance):
+                regressions.append("{} {}: {} syllables/s, baseline {}".format(
+                    name, system, measured["syllables_per_second"], expected["syllables_per_second"]))
+            growth = measured["peak_kb"] - expected["peak_kb"]
+            if growth > expected["peak_kb"] * tolerance and growth > memory_floor_kb:
+                regressions.append("{} {}: peak {} KB, baseline {} KB".format(
+                    name, system, measured["peak_kb"], expected["peak_kb"]))
+    return regressions
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmark.suite")
+    parser.add_argument("--systems", nargs="+", choices=system_lookup, default=system_lookup)
+    parser.add_argument("--corpora", nargs="+", choices=["words", "text", "options"])
+    parser.add_argument("--scale", type=float, default=1.0, help="corpus size multiplier")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes, the median is kept")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    parser.add_argument("--memory-floor", type=float, default=64, help="peak memory growth in KB always allowed")
+    args = parser.parse_args(arguments)
+
+    results = run(args.systems, args.corpora, args.scale, args.repeat)
+    print("{:>8} {:>6} {:>14} {:>9} {:>9} {:>10}".format("corpus", "system", "syllables/s", "p50 µs", "p99 µs",
+                                                         "peak KB"))
+    for name, systems in results.items():
+        for system, measured in systems.items():
+            print("{:>8} {:>6} {syllables_per_second:>14} {p50_us:>9} {p99_us:>9} {peak_kb:>10}".format(
+                name, system, **measured))
+    if args.save:
+        with open(args.save, "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as source:
+            regressions = compare(results, json.load(source), args.tolerance, args.memory_floor)
+        for regression in regressions:
+            print("regression:", regression)
+        return regressions and 1 or 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
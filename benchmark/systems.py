@@ -0,0 +1,24 @@
+"""Speed of romanise_all compared to one romanise call per system.
+
+Usage: python -m benchmark.systems [word count]
+"""
+import sys
+
+from ko_pron import romanise, romanise_all
+from ko_pron.ko_pron import system_lookup
+
+from . import best_of
+from .corpus import random_words
+
+
+def main(count=5000):
+    words = random_words(count)
+    separate = best_of(lambda: [{system: romanise(word, system) for system in system_lookup} for word in words])
+    together = best_of(lambda: [romanise_all(word) for word in words])
+    print("six romanise calls: {:>8.0f} words/s".format(count / separate))
+    print("romanise_all:       {:>8.0f} words/s".format(count / together))
+    print("speedup:            {:>8.2f}x".format(separate / together))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,22 @@
+"""Scaling of romanise with the length of a multi-word text.
+
+Usage: python -m benchmark.text [system]
+"""
+import sys
+
+from ko_pron import romanise
+
+from . import best_of
+from .corpus import mixed_text
+
+
+def main(system="rr"):
+    print("{:>8} {:>10} {:>10}".format("size", "seconds", "KB/s"))
+    for size in [1000, 10000, 100000]:
+        text = mixed_text(size)
+        elapsed = best_of(lambda: romanise(text, system))
+        print("{:>7}B {:>10.4f} {:>10.0f}".format(size, elapsed, size / 1000 / elapsed))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
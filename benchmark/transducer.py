@@ -0,0 +1,70 @@
+"""Speed of the transducer engine compared to the junction walk, and validation of the compiled tables.
+
+Usage: python -m benchmark.transducer [word count]
+       python -m benchmark.transducer --validate [system abbreviation...]
+"""
+import sys
+
+from ko_pron import romanise_many, set_engine
+from ko_pron.jamo import HANGUL_FIRST, HANGUL_COUNT
+from ko_pron.ko_pron import system_lookup, _romanise_respelling
+from ko_pron.transducer import transducer, syllable_classes, syllable_states
+
+from . import best_of
+from .corpus import random_words
+
+
+def junction_walk(word, system_index):
+    romanisation = _romanise_respelling(word, (system_index,), frozenset(), False, frozenset(), frozenset(),
+                                        frozenset(), None)
+    return "".join(romanisation[system_index])
+
+
+def validation_words():
+    # Every syllable on its own, followed by one syllable of every junction class and preceded by one
+    # syllable of every state, which covers every entry of the compiled tables
+    syllables = [chr(HANGUL_FIRST + offset) for offset in range(HANGUL_COUNT)]
+    by_class, by_state = {}, {}
+    for offset, syllable in enumerate(syllables):
+        by_class.setdefault(syllable_classes[offset], syllable)
+        by_state.setdefault(syllable_states[offset], syllable)
+    for syllable in syllables:
+        yield syllable
+        for following in by_class.values():
+            yield syllable + following
+        for preceding in by_state.values():
+            yield preceding + syllable
+
+
+def validate(system_indexes):
+    failures = 0
+    for system_index in system_indexes:
+        compiled = transducer(system_index)
+        count = 0
+        for word in validation_words():
+            count += 1
+            expected, got = junction_walk(word, system_index), compiled.transduce(word)
+            if expected != got:
+                failures += 1
+                print("{} {}: expected {!r}, got {!r}".format(system_lookup[system_index], word, expected, got))
+        print("{:>4}: {} words checked".format(system_lookup[system_index], count))
+    return failures
+
+
+def main(count=5000):
+    words = random_words(count)
+    print("{:>6} {:>14} {:>16} {:>8}".format("system", "junction w/s", "transducer w/s", "speedup"))
+    for system in system_lookup:
+        set_engine("junction")
+        walk = best_of(lambda: list(romanise_many(words, system)))
+        set_engine("transducer")
+        compiled = best_of(lambda: list(romanise_many(words, system)))
+        print("{:>6} {:>14.0f} {:>16.0f} {:>7.2f}x".format(system, count / walk, count / compiled, walk / compiled))
+    set_engine("junction")
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ["--validate"]:
+        systems = sys.argv[2:] or system_lookup
+        sys.exit(validate([system_lookup.index(system) for system in systems]) and 1)
+    main(*map(int, sys.argv[1:]))
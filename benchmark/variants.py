@@ -0,0 +1,27 @@
+"""Cost of respelling variants as options are added, with and without max_variants.
+
+Usage: python -m benchmark.variants [word length]
+"""
+import sys
+
+from ko_pron import romanise
+
+from . import best_of
+from .corpus import random_words
+
+option_names = ["ui", "ui_e", "svar", "iot", "yeored"]
+
+
+def main(length=12):
+    word = "외계" + random_words(1, seed=3, min_length=length, max_length=length)[0]
+    print("{:>7} {:>9} {:>12} {:>16}".format("options", "variants", "ms/call", "ms/call (max 4)"))
+    for count in range(len(option_names) + 1):
+        options = {name: 2 + index for index, name in enumerate(option_names[:count])}
+        variants = romanise(word, "ipa", **options).count("] ~ [") + 1
+        full = best_of(lambda: romanise(word, "ipa", **options))
+        capped = best_of(lambda: romanise(word, "ipa", max_variants=4, **options))
+        print("{:>7} {:>9} {:>12.2f} {:>16.2f}".format(count, variants, full * 1000, capped * 1000))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -1,3 +1,6 @@
 name = "ko_pron"
 
-from .ko_pron import romanise, decompose_jamo
+from .ko_pron import romanise, romanise_many, romanise_all, decompose_jamo, set_cache_size, cache_info, \
+    set_engine, instrument, set_junction_cache_size, junction_cache_info
+from .jamo import decompose_text, compose_text
+from .romaniser import Romaniser
@@ -0,0 +1,56 @@
+import argparse
+import io
+import sys
+
+from .ko_pron import system_lookup, set_cache_size
+from .stream import formats, romanise_file
+
+
+def main(arguments=None):
+    # Returns the exit status: 0, or 1 after reporting the first line that could not be romanised
+    parser = argparse.ArgumentParser(prog="python -m ko_pron",
+                                     description="Romanise Korean text line by line from files or stdin.")
+    parser.add_argument("files", nargs="*", help="input files, stdin when omitted or -")
+    parser.add_argument("-s", "--system", choices=system_lookup, default="rr", help="romanisation system")
+    parser.add_argument("-f", "--format", choices=formats, default="text", help="input format")
+    parser.add_argument("-c", "--column", type=int, default=0, help="0-based TSV column to romanise")
+    parser.add_argument("--field", default="text", help="JSONL field to romanise")
+    parser.add_argument("-o", "--output", help="output file, stdout when omitted")
+    parser.add_argument("--cap", action="store_true", help="capitalise the romanisation")
+    parser.add_argument("--errors", choices=["strict", "keep"], default="strict",
+                        help="fail on text that cannot be romanised or keep it unchanged")
+    parser.add_argument("--chunk-lines", type=int, default=1024, help="lines buffered per write")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="worker processes, 0 for one per CPU")
+    parser.add_argument("--worker-chunk", type=int, default=256, help="lines sent to a worker at a time")
+    parser.add_argument("--cache", type=int, default=0, help="size of the LRU cache of romanised runs")
+    args = parser.parse_args(arguments)
+
+    set_cache_size(args.cache)
+    output = open(args.output, "w", encoding="utf-8") if args.output else \
+        io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="")
+    try:
+        for name in args.files or ["-"]:
+            source = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="") if name == "-" else \
+                open(name, encoding="utf-8", newline="")
+            with source:
+                try:
+                    romanise_file(source, output, args.system, chunk_lines=args.chunk_lines,
+                                  input_format=args.format, column=args.column, field=args.field, errors=args.errors,
+                                  workers=args.workers or None, chunk_size=args.worker_chunk, cap=args.cap)
+                except (ValueError, IndexError, TypeError) as error:
+                    if not hasattr(error, "line_number"):
+                        raise
+                    location = "line {}".format(error.line_number) if name == "-" else \
+                        "{}: line {}".format(name, error.line_number)
+                    print("{}: {}".format(location, error), file=sys.stderr)
+                    return 1
+    finally:
+        if args.output:
+            output.close()
+        else:
+            output.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
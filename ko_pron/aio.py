@@ -0,0 +1,126 @@
+# Asyncio interface to romanisation.
+#
+# Romanisation runs on an executor so the event loop is never blocked. Lookups of the same text, system
+# and optional parameters that are in flight at the same time share one computation, and the texts of a
+# batch that are not already in flight are sent to the executor together in chunks.
+
+import asyncio
+from functools import partial
+from weakref import WeakKeyDictionary
+
+from .ko_pron import system_lookup, _normalise_options, _romanise_cached
+
+
+class AsyncRomaniser:
+    # executor - concurrent.futures executor running the romanisation, None for the default executor of
+    #            the event loop. A ProcessPoolExecutor spreads large batches over several CPUs.
+    # chunk_size - texts sent to the executor at a time
+    # An instance must only be used from one event loop at a time.
+
+    def __init__(self, executor=None, chunk_size: int = 1000):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive, got {}.".format(chunk_size))
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.computed = self.coalesced = 0
+        self._in_flight = {}
+
+    async def romanise(self, text: str, system_index, **options):
+        return (await self.romanise_many([text], system_index, **options))[0]
+
+    async def romanise_many(self, texts, system_index, **options):
+        # Returns the romanisations of the strings of the iterable "texts" as a list in input order.
+        # Raises the error of the first text in input order that cannot be romanised, once every lookup is done.
+        system_index = system_lookup.index(system_index)
+        options = _normalise_options(**options)
+        loop = asyncio.get_running_loop()
+        futures, pending, submitted = [], {}, 0
+        try:
+            for text in texts:
+                key = (text, system_index, options)
+                future = self._in_flight.get(key)
+                if future is None:
+                    future = self._in_flight[key] = pending[key] = loop.create_future()
+                else:
+                    self.coalesced += 1
+                futures.append(future)
+
+            keys = list(pending)
+            for start in range(0, len(keys), self.chunk_size):
+                chunk = keys[start:start + self.chunk_size]
+                job = loop.run_in_executor(self.executor, _romanise_batch, [text for text, _, _ in chunk],
+                                           system_index, options)
+                job.add_done_callback(partial(self._settle, [(key, pending[key]) for key in chunk]))
+                submitted = start + len(chunk)
+        except Exception as error:
+            # an unhashable text, or the executor refused the jobs (shut down or broken pool): fail the lookups
+            # registered by this call that were not submitted, so that later lookups of the same texts do not
+            # wait for them forever. No caller awaits them yet, so their exceptions are marked as retrieved.
+            for key in list(pending)[submitted:]:
+                del self._in_flight[key]
+                pending[key].set_exception(error)
+                pending[key].exception()
+            self.computed += submitted
+            raise
+        self.computed += len(keys)
+        # shielded so that a cancelled caller does not cancel the lookups it shares with other callers. Every
+        # outcome is collected so that the errors of the other failed lookups are retrieved too.
+        outcomes = await asyncio.gather(*map(asyncio.shield, futures), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return outcomes
+
+    def _settle(self, chunk, job):
+        for key, _ in chunk:
+            del self._in_flight[key]
+        if job.cancelled():
+            for _, future in chunk:
+                future.cancel()
+            return
+        outcomes = job.exception() is None and job.result() or [(False, job.exception())] * len(chunk)
+        for (_, future), (succeeded, value) in zip(chunk, outcomes):
+            if future.done():
+                continue
+            if succeeded:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def in_flight(self):
+        # Returns the number of distinct lookups being computed
+        return len(self._in_flight)
+
+
+def _romanise_batch(texts, system_index: int, options: tuple):
+    # Returns a (succeeded, romanisation or error) pair for every text, so that one text that cannot be
+    # romanised only fails the lookups of that text
+    outcomes = []
+    for text in texts:
+        try:
+            outcomes.append((True, _romanise_cached(text, system_index, options)))
+        except Exception as error:
+            outcomes.append((False, error))
+    return outcomes
+
+
+# AsyncRomaniser of every running event loop, as its in-flight futures belong to one loop
+_default_romanisers = WeakKeyDictionary()
+
+
+def _default_romaniser():
+    loop = asyncio.get_running_loop()
+    romaniser = _default_romanisers.get(loop)
+    if romaniser is None:
+        romaniser = _default_romanisers[loop] = AsyncRomaniser()
+    return romaniser
+
+
+async def romanise_async(text: str, system_index, **options):
+    # romanise on the default executor of the running event loop, sharing in-flight lookups
+    return await _default_romaniser().romanise(text, system_index, **options)
+
+
+async def romanise_many_async(texts, system_index, **options):
+    # romanise_many on the default executor of the running event loop, sharing in-flight lookups
+    return await _default_romaniser().romanise_many(texts, system_index, **options)
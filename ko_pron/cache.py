@@ -0,0 +1,72 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "size", "capacity"])
+
+
+class LRUCache:
+    # Size-bounded least-recently-used mapping with hit, miss and eviction counters.
+    # Safe to share between threads.
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("Cache capacity must be positive, got {}.".format(capacity))
+        self.capacity = capacity
+        self.hits = self.misses = self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self._data), self.capacity)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class JunctionMemo:
+    # Bounded mapping for the fragments of the junction walk, looked up once per junction.
+    # A plain dict without locking or recency tracking: when it is full it is emptied, which keeps lookups
+    # as cheap as a dict access. Counters may be slightly off when several threads romanise at once.
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("Cache capacity must be positive, got {}.".format(capacity))
+        self.capacity = capacity
+        self.lookups = self.misses = self.evictions = 0
+        self.data = {}
+
+    def put(self, key, value):
+        if len(self.data) >= self.capacity:
+            self.evictions += len(self.data)
+            self.data.clear()
+        self.data[key] = value
+
+    def hit_ratio(self):
+        return self.lookups and (self.lookups - self.misses) / self.lookups or 0.0
+
+    def info(self):
+        return CacheInfo(self.lookups - self.misses, self.misses, self.evictions, len(self.data), self.capacity)
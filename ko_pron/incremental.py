@@ -0,0 +1,119 @@
+# Romanisation of a text edited at its end, e.g. an input method or typeahead buffer.
+#
+# The text is kept as a list of segments, alternately runs of Hangul and the text between them. An edit
+# only touches the segments after the first changed character. Within a run, the junction fragment of a
+# syllable only depends on the syllables before, at and after it, so typing or deleting a syllable
+# recomputes the last two junctions; the respellings and the post-passes (tidy_phonetic, tidy_ipa) of that
+# run are then redone as romanise does.
+
+from .ko_pron import system_lookup, marker_pattern, hangul_run_pattern, decompose_syllable, _normalise_options, \
+    _romanise_respelling, _romanise_run
+
+
+def _common_prefix_length(first: str, second: str):
+    # Bisection over slice comparisons, which run in C: O(n log n) however far from the end the edit is
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[:middle] == second[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class _Segment:
+    __slots__ = ("start", "source", "is_run", "changed", "output", "syllables", "fragments")
+
+    def __init__(self, start, source, is_run, changed=0, syllables=(), fragments=()):
+        self.start, self.source, self.is_run = start, source, is_run
+        # position of the first character changed since the segment was rendered, None once rendered
+        self.changed = changed
+        self.output, self.syllables, self.fragments = "", list(syllables), list(fragments)
+
+    def edit(self, source, changed):
+        # Returns an unrendered copy with a new "source" differing from position "changed" on
+        return _Segment(self.start, source, self.is_run, changed, self.syllables, self.fragments)
+
+
+class IncrementalRomaniser:
+    # Keeps romanise(text, system_index, **options) up to date while "text" is edited.
+    # Edits near the end of the text are cheap; any edit gives the same result as romanise.
+
+    def __init__(self, system_index, text: str = "", **options):
+        self.system_index = system_lookup.index(system_index)
+        self.options = _normalise_options(**options)
+        self.text = ""
+        self._clean = ""
+        self._segments = []
+        self.set_text(text)
+
+    @property
+    def romanisation(self):
+        return "".join(segment.output for segment in self._segments)
+
+    def __str__(self):
+        return self.romanisation
+
+    def append(self, text: str):
+        # Adds "text" at the end and returns the new romanisation
+        return self.set_text(self.text + text)
+
+    def delete(self, count: int = 1):
+        # Removes the last "count" characters and returns the new romanisation
+        return self.set_text(self.text[:max(len(self.text) - count, 0)])
+
+    def set_text(self, text: str):
+        # Replaces the text and returns the new romanisation. If romanise fails on the new text the error
+        # is raised and the previous text is kept.
+        clean = marker_pattern.sub("\\1", text)
+        keep = _common_prefix_length(clean, self._clean)
+
+        segments = self._segments[:]
+        while segments and segments[-1].start >= keep:
+            segments.pop()
+        tail = clean[keep:]
+        if segments:
+            last = segments[-1]
+            cut = keep - last.start
+            if last.is_run:
+                continued = hangul_run_pattern.match(tail)
+                continued = continued.group() if continued else ""
+            else:
+                following_run = hangul_run_pattern.search(tail)
+                continued = tail[:following_run.start()] if following_run else tail
+            if cut < len(last.source) or continued:
+                segments[-1] = last.edit(last.source[:cut] + continued, cut)
+            tail = tail[len(continued):]
+
+        start, position = len(clean) - len(tail), 0
+        for run in hangul_run_pattern.finditer(tail):
+            if run.start() > position:
+                segments.append(_Segment(start + position, tail[position:run.start()], False))
+            segments.append(_Segment(start + run.start(), run.group(), True))
+            position = run.end()
+        if position < len(tail):
+            segments.append(_Segment(start + position, tail[position:], False))
+
+        for segment in segments:
+            if segment.changed is not None:
+                self._render(segment)
+        self.text, self._clean, self._segments = text, clean, segments
+        return self.romanisation
+
+    def _render(self, segment):
+        if not segment.is_run:
+            segment.output, segment.changed = segment.source, None
+            return
+        l, cap, com, nn, ui, ui_e, nobc, ni, bcred, svar, iot, yeored, max_variants = self.options
+        source, changed, system_index = segment.source, segment.changed, self.system_index
+        was_long = len(segment.syllables) > 1
+        segment.syllables[changed:] = decompose_syllable(source[changed:])
+        # the junction before the first changed syllable, or the start of the word when the length check of
+        # l=[0] for IPA flips
+        start = max(changed - 1, -1) if was_long == (len(source) > 1) else -1
+        segment.fragments[start + 1:] = _romanise_respelling(source, (system_index,), l, cap, com, nn, ni, bcred,
+                                                             segment.syllables, start)[system_index]
+        segment.output = _romanise_run(source, (system_index,), *self.options, segment.syllables,
+                                       {system_index: segment.fragments})[system_index]
+        segment.changed = None
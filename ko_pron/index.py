@@ -0,0 +1,106 @@
+# Reverse index from romanisations back to Hangul headwords, for searching a word list by romanisation.
+#
+# Every variant romanise emits (the "/" or "] ~ [" separated alternatives) becomes a key. Keys are folded
+# (see fold) so that "hangugeo" finds "han-gugeo" and "HAN'GUGŎ" finds "han'gugŏ". The index is a sorted
+# list of keys with parallel arrays of headword ids and system indexes, so exact and prefix lookups are two
+# binary searches. It is saved as JSON, gzip compressed when the file name ends with ".gz".
+
+import gzip
+import json
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice, product
+
+from .ko_pron import system_lookup, _romanise_variants
+
+ignored_characters = str.maketrans("", "", "-'’ʼ ")
+format_version = 1
+
+
+def fold(romanisation: str):
+    # Search form of a romanisation: NFC, case folded, without hyphens, apostrophes and spaces
+    return unicodedata.normalize("NFC", romanisation).casefold().translate(ignored_characters)
+
+
+def variants(headword: str, systems, max_keys: int = 64, **options):
+    # Returns {system abbreviation: list of up to "max_keys" distinct romanisations of "headword"}.
+    # Every Hangul run is romanised on its own, so the variants of texts with several runs are the
+    # combinations of the variants of each run.
+    system_indexes = [system_lookup.index(system) for system in systems]
+    pieces = _romanise_variants(headword, system_indexes, **options)
+    return {system: list(dict.fromkeys(islice(map("".join, product(*pieces[system_index])), max_keys)))
+            for system, system_index in zip(systems, system_indexes)}
+
+
+class ReverseIndex:
+
+    def __init__(self, headwords, keys, headword_ids, system_indexes):
+        # Use build or load; "keys" must be sorted with the other sequences in the same order
+        self.headwords = list(headwords)
+        self.keys = list(keys)
+        self.headword_ids = array("I", headword_ids)
+        self.system_indexes = array("B", system_indexes)
+
+    @classmethod
+    def build(cls, words, systems=("rr", "mr"), errors: str = "strict", max_keys: int = 64, **options):
+        # Indexes the romanisations of the distinct strings of the iterable "words" in "systems".
+        # errors - "strict" raises on words romanise cannot handle, "skip" leaves them out
+        if errors not in {"strict", "skip"}:
+            raise ValueError("Unknown error handling " + errors + ", expected strict or skip.")
+        systems = tuple(systems)
+        system_indexes = [system_lookup.index(system) for system in systems]
+        headwords, entries = [], set()
+        for word in dict.fromkeys(words):
+            try:
+                romanisations = variants(word, systems, max_keys, **options)
+            except (ValueError, IndexError, TypeError):
+                if errors == "strict":
+                    raise
+                continue
+            for system, system_index in zip(systems, system_indexes):
+                for romanisation in romanisations[system]:
+                    entries.add((fold(romanisation), len(headwords), system_index))
+            headwords.append(word)
+        entries = sorted(entries)
+        return cls(headwords, [entry[0] for entry in entries], [entry[1] for entry in entries],
+                   [entry[2] for entry in entries])
+
+    def _headwords(self, start, stop, systems, limit):
+        # Distinct headwords of the entries start:stop, in key order
+        allowed = systems and {system_lookup.index(system) for system in systems}
+        found = {}
+        for position in range(start, stop):
+            if not allowed or self.system_indexes[position] in allowed:
+                found.setdefault(self.headword_ids[position])
+                if limit is not None and len(found) >= limit:
+                    break
+        return [self.headwords[headword_id] for headword_id in found]
+
+    def lookup(self, romanisation: str, systems=None):
+        # Returns the headwords romanised as "romanisation" (after folding) in any of "systems", all by default
+        key = fold(romanisation)
+        return self._headwords(bisect_left(self.keys, key), bisect_right(self.keys, key), systems, None)
+
+    def prefix(self, prefix: str, systems=None, limit: int = None):
+        # Returns up to "limit" headwords with a romanisation starting with "prefix", in romanisation order
+        key = fold(prefix)
+        return self._headwords(bisect_left(self.keys, key), bisect_left(self.keys, key + "\U0010FFFF"), systems,
+                               limit)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def save(self, path: str):
+        document = {"version": format_version, "headwords": self.headwords, "keys": self.keys,
+                    "headword_ids": self.headword_ids.tolist(), "systems": self.system_indexes.tolist()}
+        with (gzip.open if path.endswith(".gz") else open)(path, "wt", encoding="utf-8") as output:
+            json.dump(document, output, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str):
+        with (gzip.open if path.endswith(".gz") else open)(path, "rt", encoding="utf-8") as source:
+            document = json.load(source)
+        if document.get("version") != format_version:
+            raise ValueError("Unsupported reverse index version {}.".format(document.get("version")))
+        return cls(document["headwords"], document["keys"], document["headword_ids"], document["systems"])
@@ -0,0 +1,62 @@
+# Per-stage timings and counters of the romanisation pipeline, collected by ko_pron.ko_pron.instrument.
+#
+# Stages, in seconds:
+#   text - substitution of the "-%\" markers, splitting the text into Hangul runs and joining the output
+#   respellings - expansion of the respelling variants of every run
+#   junctions - walking the junctions of every respelling (or running the transducers)
+#   post_passes - joining the variants and the system specific post-passes, tidy_ipa included
+#   tidy_ipa - the IPA allophone rewrites alone
+# Counters:
+#   texts, runs - romanised texts and Hangul runs
+#   variants - respellings generated, summed over the systems
+#   junctions - junctions looked up, summed over the systems
+#   regex_passes - regular expression passes over a whole string (markers, syllable breaks, tidy_ipa)
+#
+# percentile is shared by the latency statistics of ko_pron.server and benchmark.suite.
+
+from time import perf_counter
+
+stages = ("text", "respellings", "junctions", "post_passes", "tidy_ipa")
+counters = ("texts", "runs", "variants", "junctions", "regex_passes")
+
+
+def percentile(ordered, fraction: float):
+    # Nearest-rank percentile of a sorted non-empty list
+    return ordered[max(0, min(len(ordered) - 1, int(len(ordered) * fraction + 0.5) - 1))]
+
+
+class Profile:
+
+    def __init__(self, callback=None):
+        # callback - called after every romanised text with a Profile of that text alone
+        self.seconds = dict.fromkeys(stages, 0.0)
+        self.counts = dict.fromkeys(counters, 0)
+        self.callback = callback
+
+    def time(self, stage: str, function, *arguments):
+        # Returns function(*arguments), adding its duration to "stage"
+        start = perf_counter()
+        result = function(*arguments)
+        self.seconds[stage] += perf_counter() - start
+        return result
+
+    def copy(self):
+        profile = Profile()
+        profile.seconds.update(self.seconds)
+        profile.counts.update(self.counts)
+        return profile
+
+    def since(self, earlier):
+        # Returns a Profile of what was collected after the copy "earlier" was taken
+        profile = Profile()
+        for stage in stages:
+            profile.seconds[stage] = self.seconds[stage] - earlier.seconds[stage]
+        for counter in counters:
+            profile.counts[counter] = self.counts[counter] - earlier.counts[counter]
+        return profile
+
+    def as_dict(self):
+        return {"seconds": dict(self.seconds), "counts": dict(self.counts)}
+
+    def __repr__(self):
+        return "Profile(seconds={}, counts={})".format(self.seconds, self.counts)
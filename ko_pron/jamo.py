@@ -0,0 +1,96 @@
+# Precomputed decompositions of the Hangul Syllables block and of the jamo ranges accepted by romanise.
+#
+# syllable_table[cp - 0xAC00] is the (initial, vowel, final) tuple of a precomposed syllable, with "" for a
+# missing final. All tuples reference the same 19 + 21 + 28 jamo strings, so the table costs about 0.9 MB
+# (11,172 three-item tuples plus the index tuple). syllable_vowel_ids is the jungseong index (0-20) of every
+# syllable packed into 11 KB of bytes.
+# decompose_text and compose_text convert whole strings between syllables and flat conjoining jamo with
+# a str.translate mapping built from syllable_table on first use and Unicode composition of the jamo runs.
+
+import re
+import unicodedata
+from collections import namedtuple
+from functools import partial
+from itertools import product
+
+HANGUL_FIRST = 0xAC00
+HANGUL_COUNT = 11172
+
+initial_jamo = tuple(chr(0x1100 + i) for i in range(19))
+vowel_jamo = tuple(chr(0x1161 + i) for i in range(21))
+final_jamo = ("",) + tuple(chr(0x11A8 + i) for i in range(27))
+
+# the syllables are ordered by initial, then vowel, then final, which is the order of product
+syllable_table = tuple(product(initial_jamo, vowel_jamo, final_jamo))
+syllable_vowel_ids = bytes(vowel_id for vowel_id in range(len(vowel_jamo)) for _ in final_jamo) * len(initial_jamo)
+
+non_hangul = ("Ø", " ", "X")
+
+jamo_table = {}
+for cp in range(0x1100, 0x1113):
+    jamo_table[chr(cp)] = (chr(cp), "Ø", "Ø")
+for cp in range(0x1161, 0x1176):
+    jamo_table[chr(cp)] = ("Ø", chr(cp), "Ø")
+for cp in list(range(0x11A8, 0x11C3)) + list(range(0x3131, 0x318F)):
+    jamo_table[chr(cp)] = ("Ø", "Ø", chr(cp))
+del cp
+
+
+def decompose(character: str):
+    # Returns the (initial, vowel, final) tuple of a single character
+    offset = ord(character) - HANGUL_FIRST if len(character) == 1 else -1
+    if 0 <= offset < HANGUL_COUNT:
+        return syllable_table[offset]
+    return jamo_table.get(character, non_hangul)
+
+
+decomposition_map = None
+jamo_run_pattern = re.compile("[\u1100-\u11FF]+")
+
+
+def decompose_text(text: str):
+    # Replaces every precomposed syllable of "text" by its initial, vowel and final conjoining jamo
+    # (U+1100-U+11FF), in one str.translate pass. Other characters are copied unchanged.
+    global decomposition_map
+    if decomposition_map is None:
+        decomposition_map = {HANGUL_FIRST + offset: "".join(jamo) for offset, jamo in enumerate(syllable_table)}
+    return text.translate(decomposition_map)
+
+
+def compose_text(text: str):
+    # Replaces every initial + vowel (+ final) sequence of conjoining jamo of "text" by its precomposed
+    # syllable, the inverse of decompose_text. Other characters, lone jamo included, are copied unchanged.
+    # Only runs of conjoining jamo are normalised, as NFC of the whole text would also compose other scripts.
+    pieces = jamo_run_pattern.split(text)
+    if len(pieces) == 1:
+        return text
+    composed = [None] * (2 * len(pieces) - 1)
+    composed[::2] = pieces
+    composed[1::2] = map(partial(unicodedata.normalize, "NFC"), jamo_run_pattern.findall(text))
+    return "".join(composed)
+
+
+JamoArrays = namedtuple("JamoArrays", ["initial", "vowel", "final", "offsets"])
+
+
+def decompose_array(words):
+    # Decomposes every character of the strings of "words" with NumPy array arithmetic (numpy is optional and
+    # only imported here). Returns JamoArrays of int8 choseong (0-18), jungseong (0-20) and jongseong (0-27,
+    # 0 for no final) ids of all characters concatenated, -1 for characters outside the Hangul Syllables block.
+    # The characters of words[i] are at [offsets[i]:offsets[i + 1]].
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("decompose_array requires numpy, install it with: pip install ko_pron[numpy]") from None
+
+    words = words if isinstance(words, (list, tuple)) else list(words)
+    offsets = numpy.zeros(len(words) + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.fromiter(map(len, words), dtype=numpy.int64, count=len(words)), out=offsets[1:])
+    relative = numpy.frombuffer("".join(words).encode("utf-32-le"), dtype="<u4").astype(numpy.int32) - HANGUL_FIRST
+    outside = (relative < 0) | (relative >= HANGUL_COUNT)
+    jongseong = relative % 28
+    jungseong = relative % 588 // 28
+    choseong = relative // 588
+    for ids in (choseong, jungseong, jongseong):
+        ids[outside] = -1
+    return JamoArrays(choseong.astype(numpy.int8), jungseong.astype(numpy.int8), jongseong.astype(numpy.int8), offsets)
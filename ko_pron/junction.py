@@ -0,0 +1,35 @@
+# The boundary table compiled into a dense matrix of junction rows.
+#
+# Finals and initials get integer ids in the order they first appear in data.boundary. The row of the
+# junction between a final and the next initial is junction_matrix[final_id * initial_count + initial_id]
+# and holds one string per system, in system_lookup order.
+
+from .data import boundary
+
+finals = tuple(dict.fromkeys(bound.split("-")[0] for bound in boundary))
+initials = tuple(dict.fromkeys(bound.split("-")[1] for bound in boundary))
+final_ids = {final: final_id for final_id, final in enumerate(finals)}
+initial_ids = {initial: initial_id for initial_id, initial in enumerate(initials)}
+initial_count = len(initials)
+
+
+def _compile():
+    matrix = [None] * (len(finals) * initial_count)
+    for bound, row in boundary.items():
+        final, initial = bound.split("-")
+        if len(row) != 6:
+            raise ValueError("Boundary data for " + bound + " must have one junction per system.")
+        matrix[final_ids[final] * initial_count + initial_ids[initial]] = tuple(row)
+    return tuple(matrix)
+
+
+junction_matrix = _compile()
+
+
+def junction_row(final: str, initial: str):
+    # Returns the per-system junctions between "final" and the next "initial"
+    final_id, initial_id = final_ids.get(final), initial_ids.get(initial)
+    row = None if final_id is None or initial_id is None else junction_matrix[final_id * initial_count + initial_id]
+    if row is None:
+        raise ValueError("No boundary data for {}-{}.".format(final, initial))
+    return row
@@ -1,8 +1,17 @@
 import re
 import unicodedata
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice, repeat
 from math import floor
+from time import perf_counter
 
-from .data import vowels, boundary
+from .cache import LRUCache, JunctionMemo
+from .data import vowels
+from .jamo import HANGUL_FIRST, HANGUL_COUNT, syllable_vowel_ids, decompose
+from .instrumentation import Profile
+from .junction import final_ids, initial_ids, initial_count, junction_matrix, junction_row
+from .parallel import map_chunks
 
 system_lookup = ["ph", "rr", "rrr", "mr", "yr", "ipa"]
 system_list = [
@@ -56,21 +65,65 @@ allowed_vowel_scheme = {"7-0": 1, "7-5": 1, "11-0": 1, "11-5": 1, "16-5": 1}
 
 ambiguous_intersyllabic_rr = {"oe": 1, "eo": 1, "eu": 1, "ae": 1, "ui": 1}
 
+labial_initials = {"ᄆ", "ᄇ", "ᄈ", "ᄑ"}
+
+# decompositions of the positions before the first and after the last syllable of a word
+word_start = ("Ø", "Ø", "X")
+word_end = ("Ø", "Ø", "Ø")
+
+marker_pattern = re.compile('["-%](.)')
+hangul_run_pattern = re.compile("[ᄀ-ᄒ" + "ᅡ-ᅵ" + "ᆨ-ᇂ" + "ㄱ-ㆎ가-힣' ]+")
+yale_long_vowel_pattern = re.compile("([aeiou])")
+syllable_break_pattern = re.compile("(.)…(.)")
+# characters of phonetic Hangul that tidy_phonetic does not align with a syllable
+phonetic_unaligned = {"", ":", " "}
+
+# allophones and spelling rules applied by tidy_ipa
+ipa_rewrites = {
+    "ʌ̹ː": "ɘː",
+    "ɭɭj": "ɭʎj",
+    "ɭɭi": "ɭʎi",
+    "sʰɥi": "ʃʰɥi",
+    "s͈ʰɥi": "ʃ͈ʰɥi",
+    "sʰj": "ɕʰj",
+    "sʰi": "ɕʰi",
+    "s͈j": "ɕ͈j",
+    "s͈i": "ɕ͈i",
+    "nj": "ɲj",
+    "kʰi": "kçi",
+    "kʰj": "kçj",
+    "kʰɯ": "kxɯ",
+    "hi": "çi",
+    "hj": "çj",
+    "hɯ": "xɯ",
+    "ho": "ɸʷo",
+    "hu": "ɸʷu",
+    "hw": "ɸw",
+    "ɦi": "ʝi",
+    "ɦj": "ʝj",
+    "ɦɯ": "ɣɯ",
+    "ɦo": "βo",
+    "ɦu": "βu",
+    "ɦw": "βw"
+}
+ipa_rewrite_pattern = re.compile("|".join(map(re.escape, sorted(ipa_rewrites, key=len, reverse=True))))
+
 
 def romanise(text_param,
              system_index,
-             l: [int] = [],
+             l: [int] = (),
              cap: bool = False,
-             com: [int] = [],
-             nn: [int] = [],
+             com: [int] = (),
+             nn: [int] = (),
              ui: int = None,
              ui_e: int = None,
              nobc: int = None,
-             ni: [int] = [],
+             ni: [int] = (),
              bcred: int = None,
              svar: int = None,
              iot: int = None,
-             yeored: int = None):
+             yeored: int = None,
+             max_variants: int = None):
     # system_index - One of these values:
     # "ph" - phonetic hangul
     # "rr" - Revised Romanisation
@@ -78,261 +131,648 @@ def romanise(text_param,
     # "mr" - McCune-Reischauer
     # "yr" - Yale romanisation
     # "ipa" - IPA
+    # max_variants - the most respellings joined with the separator, all of them by default
+
+    return _romanise_cached(text_param, system_lookup.index(system_index),
+                            _normalise_options(l, cap, com, nn, ui, ui_e, nobc, ni, bcred, svar, iot, yeored,
+                                               max_variants))
 
+
+def romanise_many(words, system_index, workers: int = 1, chunk_size: int = 1000, **options):
+    # Romanises every string of the iterable "words" with the same system and optional parameters and returns
+    # the results as a list in input order. The system lookup, the normalisation of the optional parameters
+    # and the specialisation of a Romaniser are done once for the whole batch instead of once per word.
+    # workers - number of processes romanising chunks of "chunk_size" words, None for one per CPU
     system_index = system_lookup.index(system_index)
-    text_param = re.sub('["-%](.)', "\\1", text_param)
-    for the_original in re.finditer("[ᄀ-ᄒ" + "ᅡ-ᅵ" + "ᆨ-ᇂ" + "ㄱ-ㆎ가-힣' ]+", text_param):
-        primitive_word = the_original.string
-
-        has_vowel = {}
-        for ch in primitive_word:
-            jungseong = floor(((ord(ch) - 0xAC00) % 588) / 28)
-            if not re.search("[예옛례롄]", ch) and re.search("[가-힣]", ch):
-                has_vowel[jungseong] = True
-        word_set = [primitive_word]
-
-        if system_index in {0, 5}:
-            def add_respelling(variable, modification, modification2=lambda x: x):
-                if variable is not None:
-                    new_word_set = []
-                    for i, item in enumerate(word_set):
-                        item = item[:variable] + modification(item[variable]) + \
-                               modification2(item[variable + 1: variable + 2]) + item[variable + 2:]
-                        new_word_set.append("".join(item))
-                    word_set.extend(new_word_set)
-
-            add_respelling(ui, lambda x: "이")
-            add_respelling(ui_e, lambda x: "에")
-
-            add_respelling(nobc, lambda x: chr(ord(x) - (ord(x) - 0xAC00) % 28), lambda x: chr(ord(x) + 588))
-
-            add_respelling(svar, lambda x: chr(ord(x) - 12))
-            add_respelling(iot, lambda x: chr(ord(x) + 56))
-            add_respelling(yeored, lambda x: chr(ord(x) - 56))
-
-        for vowel_id in {7, 11, 16}:
-            if has_vowel.get(vowel_id) and "{}-{}".format(vowel_id, system_index) in allowed_vowel_scheme:
-                pre_length = len(word_set)
-                for i in range(0, pre_length):
-                    item = word_set[i]
-                    for num, it in enumerate(item):
-                        if floor(((ord(it) - 0xAC00) % 588) / 28) == vowel_id:
-                            item = item[:num] + chr(ord(it) + vowel_variation[vowel_id]) + item[num + 1:]
-                    if vowel_id == 11:
-                        word_set.insert(i, "".join(item))
-                    else:
-                        word_set.append("".join(item))
-
-        word_set_romanisations = []
-        for respelling in word_set:
-            decomposed_syllables = decompose_syllable(respelling)
-            romanisation = []
-            bold_insert_count = 0
-            for index in range(-1, len(decomposed_syllables)):
-                this_syllable = index != -1 and respelling[index:index + 1] or ""
+    options = _normalise_options(**options)
+    if workers == 1:
+        return list(map(_batch_romaniser(system_index, options), words))
+    return list(map_chunks(partial(_romanise_chunk, system_index=system_index, options=options), words, workers,
+                           chunk_size))
+
+
+def _romanise_chunk(words, system_index: int, options: tuple):
+    return list(map(_batch_romaniser(system_index, options), words))
+
+
+def _batch_romaniser(system_index: int, options: tuple):
+    # Returns the function romanising the words of a batch: a Romaniser specialised for the system and the
+    # options, or romanise itself while the cache, the junction cache or instrumentation need to see every word
+    if romanisation_cache is not None or junction_memo is not None or instrumentation is not None:
+        return partial(_romanise_cached, system_index=system_index, options=options)
+    from .romaniser import Romaniser
+    return Romaniser(system_lookup[system_index], **dict(zip(option_names, options)))
+
+
+# the optional parameters of romanise in the order of _normalise_options
+option_names = ("l", "cap", "com", "nn", "ui", "ui_e", "nobc", "ni", "bcred", "svar", "iot", "yeored", "max_variants")
+
+
+def _normalise_options(l=(), cap=False, com=(), nn=(), ui=None, ui_e=None, nobc=None, ni=(), bcred=None, svar=None,
+                       iot=None, yeored=None, max_variants=None):
+    # Returns the optional parameters as a hashable tuple in the positional order of _romanise.
+    # Only membership is ever tested on the list-typed parameters, so they become frozensets.
+    if max_variants is not None and max_variants < 1:
+        raise ValueError("max_variants must be positive, got {}.".format(max_variants))
+    return frozenset(l), bool(cap), frozenset(com), frozenset(nn), ui, ui_e, nobc, frozenset(ni), bcred, svar, \
+        iot, yeored, max_variants
+
+
+romanisation_cache = None
 
-                syllable = index != -1 and decomposed_syllables[index] or {"initial": "Ø", "vowel": "Ø", "final": "X"}
 
-                next_syllable = index < len(decomposed_syllables) - 1 and decomposed_syllables[index + 1] \
-                                or {"initial": "Ø", "vowel": "Ø", "final": "Ø"}
+def set_cache_size(capacity: int = None):
+    # Puts an LRU cache holding up to "capacity" results in front of romanise and romanise_many.
+    # Existing entries and counters are discarded. None or 0 disables caching, which is the default.
+    global romanisation_cache
+    romanisation_cache = LRUCache(capacity) if capacity else None
 
-                if syllable['final'] in final_syllable_conversion:
-                    syllable['final'] = final_syllable_conversion[syllable['final']]
 
-                if system_index == 4 and syllable['vowel'] == "ᅮ" and match(syllable['initial'], "[ᄆᄇᄈᄑ]"):
-                    syllable['vowel'] = "ᅳ"
-
-                if system_index in {0, 5}:
-                    if syllable['vowel'] == "ᅴ" and this_syllable != "의":
-                        syllable['vowel'] = "ᅵ"
-                    if this_syllable == "넓":
-                        if match(next_syllable['initial'], "[ᄌᄉ]"):
-                            syllable['final'] = "ᆸ"
-                        elif next_syllable['initial'] == "ᄃ":
-                            if match(next_syllable['vowel'], "[^ᅡᅵ]"):
-                                syllable['final'] = "ᆸ"
-
-                vowel = vowels[syllable['vowel']][system_index]
-
-                if index + 1 in nn:
-                    next_syllable['initial'] = "ᄂ"
-                if index in com and system_index in {0, 5}:
-                    next_initial = next_syllable['initial']
-                    next_syllable['initial'] = com_ph[next_initial] if next_initial in com_ph else next_initial
-
-                if index + 1 in ni and system_index != 2:
-                    next_syllable['initial'] = (system_index == 4 and syllable['final'] == "ᆯ") and "ᄅ" or "ᄂ"
-
-                if system_index not in {2, 4}:
-                    if bcred == index:
-                        syllable['final'] = boundary[syllable['final'] + "-Ø"][0]
-
-                    if index != -1 and this_syllable == "밟":
-                        syllable['final'] = "ᆸ"
-
-                    final_next_syllable = syllable['final'] + respelling[index + 1: index + 2]
-                    if match(final_next_syllable, "[ᇀᆴ][이히]"):
-                        syllable['final'] = "ᆾ"
-
-                    elif match(final_next_syllable, "ᆮ이"):
-                        syllable['final'] = "ᆽ"
-
-                    elif match(final_next_syllable, "ᆮ히"):
-                        syllable['final'] = "ᆾ"
-
-                bound = "{}-{}".format(syllable['final'], next_syllable['initial'])
-                if bound not in boundary:
-                    raise ValueError("No boundary data for " + bound + ".")
-
-                junction = boundary[bound][system_index]
-
-                if index in l:
-                    if system_index == 0:
-                        def substitute(matched):
-                            a, b = matched.group(1), matched.group(2)
-                            return match(a, "[ᆨ-ᇂ]") and a + ":" + b or ":" + a + b
-
-                        junction = gsub(junction, "^(.)(.?)$", substitute)
-
-                    elif system_index == 4:
-                        vowel = gsub(vowel, "([aeiou])", "\\1̄")
-
-                    elif system_index == 5:
-                        vowel = vowel + "ː"
-
-                if 0 in l and index == -1 and system_index == 5 and len(decomposed_syllables) > 1:
-                    vowel = vowel + "ˈ"
-
-                if index in com:
-                    def substitute(next_letter):
-                        letter_val = next_letter.group()
-                        return (system_index == 4 and "q" or "") \
-                               + (system_index == 3
-                                  and (com_mc.get(letter_val + (cap and 1 or "")) or
-                                       com_mc.get(letter_val)
-                                       or letter_val) or letter_val)
-
-                    junction = gsub(junction, "(.)$", substitute)
-
-                if index + 1 in ni and system_index == 4:
-                    junction = gsub(junction, "n$", "ⁿ")
-                    junction = gsub(junction, "l$", "ˡ")
-
-                romanisation.append(vowel + junction)
-
-            temp_romanisation = "".join(romanisation)
-            if cap and system_index not in {0, 5}:
-                temp_romanisation = temp_romanisation[0].upper() + temp_romanisation[1:]
-
-            if system_index == 0:
-                temp_romanisation = tidy_phonetic(primitive_word, unicodedata.normalize('NFC', temp_romanisation))
-            elif system_index in {1, 2}:
-                for i in range(0, 2):
-                    def substitute(matched):
-                        a, b = matched.group(1), matched.group(2)
-                        return a + (ambiguous_intersyllabic_rr.get(a + b) and "-" or "") + b
-
-                    temp_romanisation = gsub(temp_romanisation, "(.)…(.)", substitute)
-            elif system_index == 3:
-                temp_romanisation = gsub(temp_romanisation, "swi", "shwi")
-            word_set_romanisations.append(temp_romanisation)
-
-        text_param = gsub(
-            text_param,
-            primitive_word,
-            system_list[system_index]['separator'].join(word_set_romanisations),
-            1
-        )
+def cache_info():
+    # Returns CacheInfo(hits, misses, evictions, size, capacity), or None when caching is disabled
+    return romanisation_cache.info() if romanisation_cache is not None else None
+
+
+junction_memo = None
+
+
+def set_junction_cache_size(capacity: int = None):
+    # Memoises up to "capacity" junction fragments keyed on their local context (the syllables around the
+    # junction, the system and the positional parameters that apply there), shared by all words.
+    # None or 0 disables it, which is the default.
+    global junction_memo
+    junction_memo = JunctionMemo(capacity) if capacity else None
+
+
+def junction_cache_info():
+    # Returns CacheInfo(hits, misses, evictions, size, capacity) of the junction cache, or None when disabled
+    return junction_memo.info() if junction_memo is not None else None
+
+
+romanisation_engine = "junction"
+transduce_all = None
+
+
+def set_engine(name: str):
+    # Selects how words without the l, com, nn, ni and bcred parameters are romanised into one system:
+    # "junction" - walk the junctions of every word (the default)
+    # "transducer" - run the compiled per-system transducers of ko_pron.transducer
+    # Both give the same results. Several systems at once (romanise_all) always use the transducers.
+    global romanisation_engine
+    if name not in {"junction", "transducer"}:
+        raise ValueError("Unknown engine " + name + ", expected junction or transducer.")
+    romanisation_engine = name
+
+
+instrumentation = None
+
+
+@contextmanager
+def instrument(callback=None):
+    # Collects per-stage timings and counters of every romanisation made while the block runs, in the
+    # Profile it yields (see ko_pron.instrumentation). "callback" is called after every romanised text with
+    # the Profile of that text alone. Cache hits are not romanised and are not counted. The collection is
+    # process wide and replaces the one of an enclosing block until this block ends.
+    global instrumentation
+    previous, instrumentation = instrumentation, Profile(callback)
+    try:
+        yield instrumentation
+    finally:
+        instrumentation = previous
+
+
+def _romanise_cached(text_param, system_index: int, options: tuple):
+    cache = romanisation_cache
+    if cache is None:
+        return _romanise(text_param, system_index, *options)
+    key = (text_param, system_index) + options
+    result = cache.get(key)
+    if result is None:
+        result = _romanise(text_param, system_index, *options)
+        cache.put(key, result)
+    return result
+
+
+all_system_indexes = tuple(range(len(system_lookup)))
+
+
+def romanise_all(text_param, systems=None, **options):
+    # Romanises "text_param" into several systems at once and returns a dict keyed by system abbreviation.
+    # "systems" is an iterable of abbreviations from system_lookup, all of them by default.
+    # Every respelling is walked once for all requested systems, through the compiled transducers of
+    # ko_pron.transducer without the positional parameters, otherwise by decomposing it and walking its junctions.
+    system_indexes = all_system_indexes if not systems else \
+        tuple(dict.fromkeys(system_lookup.index(system) for system in systems))
+    results = _romanise_systems(text_param, system_indexes, **options)
+    return {system_lookup[system_index]: results[system_index] for system_index in system_indexes}
+
+
+def _romanise(text_param, system_index: int, *options, **keyword_options):
+    return _romanise_systems(text_param, (system_index,), *options, **keyword_options)[system_index]
+
+
+def _romanise_systems(text_param,
+                      system_indexes: tuple,
+                      l=(),
+                      cap: bool = False,
+                      com=(),
+                      nn=(),
+                      ui: int = None,
+                      ui_e: int = None,
+                      nobc: int = None,
+                      ni=(),
+                      bcred: int = None,
+                      svar: int = None,
+                      iot: int = None,
+                      yeored: int = None,
+                      max_variants: int = None):
+    # Every run of Hangul in the text is romanised on its own and the text between runs is copied unchanged.
+    # The positions given in the optional parameters are relative to the start of each run.
+    profile = instrumentation
+    if profile is not None:
+        start, before = perf_counter(), profile.copy()
+    text_param = marker_pattern.sub("\\1", text_param)
+    if hangul_run_pattern.fullmatch(text_param):
+        # a single word, nothing to copy around it
+        results = _romanise_run(text_param, system_indexes, l, cap, com, nn, ui, ui_e, nobc, ni, bcred, svar, iot,
+                                yeored, max_variants)
+    else:
+        pieces = {system_index: [] for system_index in system_indexes}
+        runs, tail = _split_runs(text_param)
+        for gap, primitive_word in runs:
+            romanised = _romanise_run(primitive_word, system_indexes, l, cap, com, nn, ui, ui_e, nobc, ni, bcred,
+                                      svar, iot, yeored, max_variants)
+            for system_index in system_indexes:
+                pieces[system_index] += gap, romanised[system_index]
+        results = {system_index: "".join(system_pieces) + tail for system_index, system_pieces in pieces.items()}
+    if profile is not None:
+        _profile_text(profile, before, perf_counter() - start)
+    return results
+
+
+def _split_runs(text_param):
+    # Returns the Hangul runs of the text as a list of (text before the run, run) and the text after the last run
+    runs, position = [], 0
+    for run in hangul_run_pattern.finditer(text_param):
+        runs.append((text_param[position:run.start()], run.group()))
+        position = run.end()
+    return runs, text_param[position:]
+
+
+def _romanise_variants(text_param, system_indexes, **options):
+    # Returns {system index: list of lists of alternatives} for the reverse index: the text around the runs as
+    # single alternatives and, for every run, the variants romanise joins with the separator of the system
+    runs, tail = _split_runs(marker_pattern.sub("\\1", text_param))
+    options = _normalise_options(**options)
+    pieces = {system_index: [] for system_index in system_indexes}
+    for gap, primitive_word in runs:
+        romanised = _romanise_run(primitive_word, system_indexes, *options)
+        for system_index in system_indexes:
+            pieces[system_index] += [gap], romanised[system_index].split(system_list[system_index]["separator"])
+    for system_index in system_indexes:
+        pieces[system_index].append([tail])
+    return pieces
+
+
+def _profile_text(profile, before, elapsed):
+    profile.seconds["text"] += elapsed - sum(profile.seconds[stage] - before.seconds[stage]
+                                             for stage in ("respellings", "junctions", "post_passes"))
+    profile.counts["texts"] += 1
+    profile.counts["regex_passes"] += 1
+    if profile.callback is not None:
+        profile.callback(profile.since(before))
+
+
+def _romanise_run(primitive_word, system_indexes, l, cap, com, nn, ui, ui_e, nobc, ni, bcred, svar, iot, yeored,
+                  max_variants, base_syllables=None, base=None):
+    # Romanises one run of Hangul for every system of "system_indexes" and returns the texts keyed by system.
+    # "base_syllables" and "base" can pass in the decomposition and the junction fragments of the run
+    # computed earlier for all of "system_indexes".
+    profile = instrumentation
+    if profile is not None:
+        started = perf_counter()
+    word_sets = _run_respellings(primitive_word, system_indexes, ui, ui_e, nobc, svar, iot, yeored, max_variants)
+
+    if profile is not None:
+        respelled = perf_counter()
+        profile.seconds["respellings"] += respelled - started
+        profile.counts["runs"] += 1
+        profile.counts["variants"] += sum(map(len, word_sets.values()))
+
+    # systems sharing a respelling romanise it together
+    respelling_systems = {}
+    for system_index, word_set in word_sets.items():
+        for respelling in word_set:
+            shared = respelling_systems.get(respelling)
+            if shared is None:
+                respelling_systems[respelling] = [system_index]
+            elif system_index not in shared:
+                shared.append(system_index)
+    romanised = None
+    if (romanisation_engine == "transducer" or len(system_indexes) > 1) and base is None \
+            and not (l or com or nn or ni) and bcred is None:
+        romanised = _transduce_respellings(respelling_systems)
+    if romanised is None:
+        # respellings only recompute the junctions around the syllables that differ from the primitive word
+        if base is None:
+            base_syllables = decompose_syllable(primitive_word)
+            base = _romanise_respelling(primitive_word, system_indexes, l, cap, com, nn, ni, bcred, base_syllables)
+        romanised = {}
+        for respelling, shared in respelling_systems.items():
+            fragments = _romanise_variant(respelling, primitive_word, base_syllables, base, shared, l, cap, com, nn,
+                                          ni, bcred)
+            romanised[respelling] = {system_index: "".join(fragments[system_index]) for system_index in shared}
+
+    if profile is not None:
+        walked = perf_counter()
+        profile.seconds["junctions"] += walked - respelled
+    results = {}
+    for system_index, word_set in word_sets.items():
+        if len(word_set) == 1:
+            text = _finish_romanisation(primitive_word, romanised[word_set[0]][system_index], system_index, cap)
+        else:
+            text = system_list[system_index]['separator'].join([
+                _finish_romanisation(primitive_word, romanised[respelling][system_index], system_index, cap)
+                for respelling in word_set])
         if system_index == 5:
-            text_param = tidy_ipa(text_param)
-    return text_param
+            if profile is None:
+                text = tidy_ipa(text)
+            else:
+                text = profile.time("tidy_ipa", tidy_ipa, text)
+                profile.counts["regex_passes"] += 1
+        results[system_index] = text
+    if profile is not None:
+        profile.seconds["post_passes"] += perf_counter() - walked
+    return results
+
+
+def _run_respellings(primitive_word, system_indexes, ui, ui_e, nobc, svar, iot, yeored, max_variants):
+    # Returns {system index: list of the respellings of "primitive_word" romanised in that system}. Only
+    # phonetic Hangul and IPA have respellings, the other systems romanise the word itself.
+    word_sets, has_vowel = {}, None
+    for system_index in system_indexes:
+        if system_index not in respelled_systems:
+            word_sets[system_index] = [primitive_word]
+            continue
+        if has_vowel is None:
+            has_vowel = {}
+            for ch in primitive_word:
+                offset = ord(ch) - HANGUL_FIRST
+                if 0 <= offset < HANGUL_COUNT and ch not in "예옛례롄":
+                    has_vowel[syllable_vowel_ids[offset]] = True
+            unvaried = ui is None and ui_e is None and nobc is None and svar is None and iot is None \
+                and yeored is None and not has_vowel.keys() & varied_vowel_ids
+        if unvaried:
+            word_sets[system_index] = [primitive_word]
+            continue
+        word_sets[system_index] = list(islice(_respellings(primitive_word, has_vowel, system_index, ui, ui_e, nobc,
+                                                           svar, iot, yeored), max_variants))
+    return word_sets
+
+
+def _transduce_respellings(respelling_systems):
+    # Romanises the respellings with the compiled transducers, walking every respelling once for the systems
+    # sharing it, or returns None when a respelling has characters the transducers do not handle.
+    # junctions are only counted when every respelling transduced, as the junction walk counts them otherwise
+    global transduce_all
+    if transduce_all is None:
+        from .transducer import transduce_all
+    romanised, junctions = {}, 0
+    for respelling, shared in respelling_systems.items():
+        transduced = transduce_all(respelling, shared)
+        if transduced is None:
+            return None
+        romanised[respelling] = transduced
+        junctions += (len(respelling) + 1) * len(shared)
+    if instrumentation is not None:
+        instrumentation.counts["junctions"] += junctions
+    return romanised
+
+
+# systems with respellings: the respelling parameters and the vowel variations of allowed_vowel_scheme
+respelled_systems = {0, 5}
+varied_vowel_ids = {16, 11, 7}
+# modifications of the syllable at, and of the syllable after, the position given in ui, ui_e, nobc, svar, iot
+# and yeored
+respelling_modifications = (
+    (lambda x: "이", None),
+    (lambda x: "에", None),
+    (lambda x: chr(ord(x) - (ord(x) - 0xAC00) % 28), lambda x: chr(ord(x) + 588)),
+    (lambda x: chr(ord(x) - 12), None),
+    (lambda x: chr(ord(x) + 56), None),
+    (lambda x: chr(ord(x) - 56), None),
+)
+
+
+def _respellings(primitive_word, has_vowel, system_index, ui, ui_e, nobc, svar, iot, yeored):
+    # Lazily yields the respellings of "primitive_word" which are romanised and joined with the separator.
+    # Every applicable option doubles the respellings: the modified ones follow the unmodified ones, except
+    # for the ᅬ variation which puts copies of the first modified respelling in front.
+    stages = []
+    if system_index in respelled_systems:
+        for variable, (modification, modification2) in zip((ui, ui_e, nobc, svar, iot, yeored),
+                                                           respelling_modifications):
+            if variable is not None:
+                stages.append((False, partial(_respell, variable=variable, modification=modification,
+                                              modification2=modification2)))
+
+    for vowel_id in (16, 11, 7):
+        if has_vowel.get(vowel_id) and "{}-{}".format(vowel_id, system_index) in allowed_vowel_scheme:
+            stages.append((vowel_id == 11, partial(_vary_vowel, vowel_id=vowel_id)))
+    return _expand_respellings(primitive_word, stages)
+
+
+def _expand_respellings(word, stages):
+    if not stages:
+        yield word
+        return
+    in_front, modify = stages[-1]
+    if in_front:
+        first = modify(next(_expand_respellings(word, stages[:-1])))
+        yield from repeat(first, 2 ** (len(stages) - 1))
+        yield from _expand_respellings(word, stages[:-1])
+    else:
+        yield from _expand_respellings(word, stages[:-1])
+        yield from map(modify, _expand_respellings(word, stages[:-1]))
+
+
+def _respell(item, variable, modification, modification2=None):
+    following = item[variable + 1: variable + 2]
+    return item[:variable] + modification(item[variable]) + \
+        (modification2(following) if modification2 else following) + item[variable + 2:]
+
+
+def _vary_vowel(item, vowel_id):
+    variation = vowel_variation[vowel_id]
+    return "".join(floor(((ord(it) - 0xAC00) % 588) / 28) == vowel_id and chr(ord(it) + variation) or it
+                   for it in item)
+
+
+def _romanise_variant(respelling, primitive_word, base_syllables, base, system_indexes, l, cap, com, nn, ni, bcred):
+    # Romanises "respelling" for "system_indexes" reusing the decomposition "base_syllables" and the fragments
+    # "base" of "primitive_word". The fragment of a junction only depends on the syllables before, at and
+    # after it, so only the junctions next to a changed syllable are recomputed.
+    if len(respelling) != len(primitive_word):
+        return _romanise_respelling(respelling, system_indexes, l, cap, com, nn, ni, bcred)
+    changed = [position for position, (a, b) in enumerate(zip(respelling, primitive_word)) if a != b]
+    decomposed_syllables = list(base_syllables)
+    for position in changed:
+        decomposed_syllables[position] = decompose(respelling[position])
+    romanisations = {system_index: list(base[system_index]) for system_index in system_indexes}
+    last = len(respelling) - 1
+    stale = sorted({index for position in changed
+                    for index in range(max(position - 1, -1), min(position + 1, last) + 1)})
+    while stale:
+        start = stop = stale.pop(0)
+        while stale and stale[0] == stop + 1:
+            stop = stale.pop(0)
+        fragments = _romanise_respelling(respelling, system_indexes, l, cap, com, nn, ni, bcred,
+                                         decomposed_syllables, start, stop + 1)
+        for system_index in system_indexes:
+            romanisations[system_index][start + 1:stop + 2] = fragments[system_index]
+    return romanisations
+
+
+def _romanise_respelling(respelling, system_indexes, l, cap, com, nn, ni, bcred, decomposed_syllables=None,
+                         start=-1, stop=None):
+    # Walks the junctions of "respelling" once, building the romanisation of every system of "system_indexes".
+    # Returns the lists of romanised fragments keyed by system index, one per index from "start" (-1 being
+    # the start of the word) up to "stop" (the end of the word by default).
+    if decomposed_syllables is None:
+        decomposed_syllables = decompose_syllable(respelling)
+    if instrumentation is not None:
+        instrumentation.counts["junctions"] += \
+            ((len(decomposed_syllables) if stop is None else stop) - start) * len(system_indexes)
+    if junction_memo is not None:
+        return _memoised_junctions(respelling, system_indexes, l, cap, com, nn, ni, bcred, decomposed_syllables,
+                                   start, stop)
+    return _walk_junctions(respelling, system_indexes, l, cap, com, nn, ni, bcred, decomposed_syllables, start, stop)
+
+
+def _memoised_junctions(respelling, system_indexes, l, cap, com, nn, ni, bcred, decomposed_syllables, start, stop):
+    # _walk_junctions through junction_memo. The fragment at an index only depends on the syllables before
+    # (for ni), at and after it and on the positional parameters at and around the index, so these are the key.
+    memo = junction_memo
+    memo_data, put = memo.data, memo.put
+    stop = len(decomposed_syllables) if stop is None else stop
+    memo.lookups += (stop - start) * len(system_indexes)
+    positional = l or com or nn or ni or bcred is not None
+    romanisations = {system_index: [] for system_index in system_indexes}
+    for index in range(start, stop):
+        this_syllable = index != -1 and respelling[index] or ""
+        next_letter = respelling[index + 1:index + 2]
+        if positional:
+            flags = (index in l, index in com, index + 1 in nn, index + 1 in ni, bcred == index, index in nn,
+                     index - 1 in com, index in ni, index == -1 and 0 in l and len(decomposed_syllables) > 1,
+                     cap and index in com)
+            previous = index in ni and index > 0 and respelling[index - 1] or ""
+        else:
+            flags, previous = None, ""
+        for system_index in system_indexes:
+            key = (system_index, previous, this_syllable, next_letter, flags)
+            fragment = memo_data.get(key)
+            if fragment is None:
+                memo.misses += 1
+                fragment = _walk_junctions(respelling, (system_index,), l, cap, com, nn, ni, bcred,
+                                           decomposed_syllables, index, index + 1)[system_index][0]
+                put(key, fragment)
+            romanisations[system_index].append(fragment)
+    return romanisations
+
+
+def _walk_junctions(respelling, system_indexes, l, cap, com, nn, ni, bcred, decomposed_syllables, start, stop):
+    romanisations = {system_index: [] for system_index in system_indexes}
+    # initial of the current syllable as modified by nn, com and ni while processing the previous junction
+    initials = {system_index: _modified_initial(decomposed_syllables, start, system_index, com, nn, ni)
+                for system_index in system_indexes}
+    for index in range(start, len(decomposed_syllables) if stop is None else stop):
+        this_syllable = index != -1 and respelling[index:index + 1] or ""
+
+        _, syllable_vowel, syllable_final = index != -1 and decomposed_syllables[index] or word_start
+
+        next_syllable = index < len(decomposed_syllables) - 1 and decomposed_syllables[index + 1] or word_end
+
+        syllable_final = final_syllable_conversion.get(syllable_final, syllable_final)
+        next_letter = respelling[index + 1: index + 2]
+
+        for system_index in system_indexes:
+            initial, vowel_jamo, final = initials[system_index], syllable_vowel, syllable_final
+            next_initial = next_syllable[0]
+
+            if system_index == 4 and vowel_jamo == "ᅮ" and initial in labial_initials:
+                vowel_jamo = "ᅳ"
+
+            if system_index in {0, 5}:
+                if vowel_jamo == "ᅴ" and this_syllable != "의":
+                    vowel_jamo = "ᅵ"
+                if this_syllable == "넓":
+                    if next_initial in {"ᄌ", "ᄉ"}:
+                        final = "ᆸ"
+                    elif next_initial == "ᄃ":
+                        if next_syllable[1] not in {"ᅡ", "ᅵ"}:
+                            final = "ᆸ"
+
+            vowel = vowels[vowel_jamo][system_index]
+
+            if index + 1 in nn:
+                next_initial = "ᄂ"
+            if index in com and system_index in {0, 5}:
+                next_initial = com_ph[next_initial] if next_initial in com_ph else next_initial
+
+            if index + 1 in ni and system_index != 2:
+                next_initial = (system_index == 4 and final == "ᆯ") and "ᄅ" or "ᄂ"
+
+            if system_index not in {2, 4}:
+                if bcred == index:
+                    final = junction_row(final, "Ø")[0]
+
+                if index != -1 and this_syllable == "밟":
+                    final = "ᆸ"
+
+                if next_letter in {"이", "히"}:
+                    if final in {"ᇀ", "ᆴ"}:
+                        final = "ᆾ"
+
+                    elif final == "ᆮ":
+                        final = next_letter == "이" and "ᆽ" or "ᆾ"
+
+            final_id, initial_id = final_ids.get(final), initial_ids.get(next_initial)
+            if final_id is None or initial_id is None:
+                raise ValueError("No boundary data for {}-{}.".format(final, next_initial))
+            junction = junction_matrix[final_id * initial_count + initial_id][system_index]
+
+            if index in l:
+                if system_index == 0:
+                    if 1 <= len(junction) <= 2:
+                        a, b = junction[0], junction[1:]
+                        junction = "ᆨ" <= a <= "ᇂ" and a + ":" + b or ":" + a + b
+
+                elif system_index == 4:
+                    vowel = yale_long_vowel_pattern.sub("\\1̄", vowel)
+
+                elif system_index == 5:
+                    vowel = vowel + "ː"
+
+            if 0 in l and index == -1 and system_index == 5 and len(decomposed_syllables) > 1:
+                vowel = vowel + "ˈ"
+
+            if index in com and junction:
+                letter_val = junction[-1]
+                junction = junction[:-1] + (system_index == 4 and "q" or "") \
+                    + (system_index == 3
+                       and (com_mc.get(letter_val + (cap and 1 or "")) or
+                            com_mc.get(letter_val)
+                            or letter_val) or letter_val)
+
+            if index + 1 in ni and system_index == 4:
+                if junction.endswith("n"):
+                    junction = junction[:-1] + "ⁿ"
+                elif junction.endswith("l"):
+                    junction = junction[:-1] + "ˡ"
+
+            romanisations[system_index].append(vowel + junction)
+            initials[system_index] = next_initial
+    return romanisations
+
+
+def _modified_initial(decomposed_syllables, index, system_index, com, nn, ni):
+    # Returns the initial of syllable "index" as modified by the junction before it
+    if index == -1:
+        return "Ø"
+    initial = decomposed_syllables[index][0]
+    if index in nn:
+        initial = "ᄂ"
+    if index - 1 in com and system_index in {0, 5}:
+        initial = com_ph[initial] if initial in com_ph else initial
+    if index in ni and system_index != 2:
+        previous_final = index > 0 and decomposed_syllables[index - 1][2] or "X"
+        initial = (system_index == 4 and previous_final == "ᆯ") and "ᄅ" or "ᄂ"
+    return initial
+
+
+def _finish_romanisation(primitive_word, romanisation, system_index, cap):
+    # Applies the capitalisation and the system specific post-passes to the joined fragments of one respelling
+    if cap and system_index not in {0, 5}:
+        romanisation = romanisation[0].upper() + romanisation[1:]
+    return post_passes[system_index](primitive_word, romanisation)
+
+
+def _finish_phonetic(primitive_word, romanisation):
+    return tidy_phonetic(primitive_word, unicodedata.normalize('NFC', romanisation))
+
+
+def _finish_revised(primitive_word, romanisation):
+    for i in range(0, 2):
+        if "…" in romanisation:
+            romanisation = syllable_break_pattern.sub(_syllable_break, romanisation)
+            if instrumentation is not None:
+                instrumentation.counts["regex_passes"] += 1
+    return romanisation
+
+
+def _finish_mccune_reischauer(primitive_word, romanisation):
+    return romanisation.replace("swi", "shwi")
+
+
+def _finish_unchanged(primitive_word, romanisation):
+    return romanisation
+
+
+# post-pass of every system, in system_lookup order
+post_passes = (_finish_phonetic, _finish_revised, _finish_revised, _finish_mccune_reischauer, _finish_unchanged,
+               _finish_unchanged)
+
+
+def _syllable_break(matched):
+    a, b = matched.group(1), matched.group(2)
+    return a + (ambiguous_intersyllabic_rr.get(a + b) and "-" or "") + b
 
 
 def decompose_syllable(word: str):
-    return [decompose_jamo(syllable) for syllable in word]
+    # Returns the shared (initial, vowel, final) tuples of the characters of "word"
+    return list(map(decompose, word))
 
 
 def tidy_phonetic(original: str, romanised: str):
-    j, k, w = 0, 0, []
-    for i in range(0, len(romanised)):
-        romanised_syllable = romanised[k:k + 1]
-        original_syllable = original[j:j + 1]
-
-        w += romanised_syllable
+    # Aligns the phonetic Hangul "romanised" against the "original" word, one output character per character
+    # of "romanised". Once "romanised" is used up the remaining output characters are empty, so the walk stops.
+    if romanised == original:
+        return romanised
+    length, original_length = len(romanised), len(original)
+    aligned = [""] * length
+    j = k = 0
+    for i in range(length):
+        if k >= length:
+            break
+        romanised_syllable = romanised[k]
+        original_syllable = original[j] if j < original_length else ""
+
+        aligned[i] = romanised_syllable
         if romanised_syllable != original_syllable:
-            if match(original_syllable, "[^: ]"):
-                k = k + 1
-            if match(romanised_syllable, "[^: ]"):
-                j = j + 1
+            if original_syllable not in phonetic_unaligned:
+                k += 1
+            if romanised_syllable not in phonetic_unaligned:
+                j += 1
         else:
             j, k = j + 1, k + 1
-    return "".join(w)
+    return "".join(aligned)
 
 
 def tidy_ipa(ipa: str):
-    ipa = re.sub("ʌ̹ː", "ɘː", ipa)
-    ipa = re.sub("ɭɭ([ji])", "ɭʎ\\1", ipa)
-    ipa = re.sub("s([͈]?)ʰɥi", "ʃ\\1ʰɥi", ipa)
-    ipa = re.sub("s([ʰ͈])([ji])", "ɕ\\1\\2", ipa)
-    ipa = re.sub("nj", "ɲj", ipa)
-
-    for key, value in {
-        "kʰi": "kçi",
-        "kʰj": "kçj",
-        "kʰɯ": "kxɯ"
-    }.items():
-        ipa = ipa.replace(key, value)
-
-    for key, value in {
-        "hi": "çi",
-        "hj": "çj",
-        "hɯ": "xɯ",
-        "ho": "ɸʷo",
-        "hu": "ɸʷu",
-        "hw": "ɸw",
-        "ɦi": "ʝi",
-        "ɦj": "ʝj",
-        "ɦɯ": "ɣɯ",
-        "ɦo": "βo",
-        "ɦu": "βu",
-        "ɦw": "βw"
-    }.items():
-        ipa = ipa.replace(key, value)
-
-    if match(ipa, "ɥi"):
+    # Every rewrite is done in a single scan; no replacement creates or breaks a match of another rewrite,
+    # so this is the same as applying them one after another
+    ipa = ipa_rewrite_pattern.sub(_rewrite_ipa, ipa)
+    if "ɥi" in ipa:
         midpoint = floor(len(ipa) / 2)
         ipa = ipa[0:midpoint] + ipa[midpoint:].replace("ɥi", "y")
     return ipa
 
 
-def gsub(string, pattern, replacement, count=0):
-    return re.sub(pattern, replacement, string, count)
-
-
-def match(string, regex):
-    return re.search(regex, string)
+def _rewrite_ipa(match):
+    return ipa_rewrites[match.group()]
 
 
 def decompose_jamo(syllable):
-    if not match(syllable, "[가-힣]"):
-        if match(syllable, "[ᄀ-ᄒ]"):
-            return {'initial': syllable, 'vowel': "Ø", 'final': "Ø"}
-        elif match(syllable, "[ᅡ-ᅵ]"):
-            return {'initial': "Ø", 'vowel': syllable, 'final': "Ø"}
-        elif match(syllable, "[ᆨ-ᇂ]"):
-            return {'initial': "Ø", 'vowel': "Ø", 'final': syllable}
-        elif match(syllable, "[ㄱ-ㆎ]"):
-            return {'initial': "Ø", 'vowel': "Ø", 'final': syllable}
-        else:
-            return {'initial': "Ø", 'vowel': " ", 'final': "X"}
-
-    cp = ord(syllable)
-    if not cp:
-        return {"", "", ""}
-    relative_cp = cp - 0xAC00
-    jongseong = relative_cp % 28
-    jungseong = floor((relative_cp % 588) / 28)
-    choseong = floor(relative_cp / 588)
-    choseong, jungseong, jongseong = chr(0x1100 + choseong), chr(0x1161 + jungseong), \
-                                     jongseong != 0 and chr(0x11A7 + jongseong) or ""
-    return {'initial': choseong, 'vowel': jungseong, 'final': jongseong}
+    # Public dict form of jamo.decompose; a new dict on every call
+    initial, vowel, final = decompose(syllable)
+    return {'initial': initial, 'vowel': vowel, 'final': final}
@@ -0,0 +1,226 @@
+# Prebuilt romanisation lexicon: a binary file of words and their romanisations, memory-mapped for lookup.
+#
+# Layout, all integers unsigned 32-bit little-endian, every section starting on a 4-byte boundary:
+#   magic "KOPRLEX1", metadata length, UTF-8 JSON metadata {"systems": [...], "options": {...}}
+#   word count n, key offsets (n + 1), romanisation offsets (n * systems + 1)
+#   keys: the UTF-8 words in sorted order, romanisations: UTF-8, the systems of every word in turn
+# Lookups binary search the keys in place, so processes opening the same file share it through the page
+# cache and opening it costs no parsing. Words missing from the lexicon are romanised with romanise and
+# the options the lexicon was built with.
+#
+# Usage: python -m ko_pron.lexicon build words.txt -o words.lex -s rr mr [-j workers]
+#        python -m ko_pron.lexicon lookup words.lex 한국어 [-s rr]
+
+import argparse
+import json
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+from functools import partial
+
+from .ko_pron import system_lookup, romanise, romanise_all
+from .parallel import map_chunks
+
+magic = b"KOPRLEX1"
+offset_limit = 2 ** 32 - 1
+
+
+def _padding(size: int):
+    return b"\0" * (-size % 4)
+
+
+def _little_endian(offsets: array):
+    if sys.byteorder != "little":
+        offsets = array("I", offsets)
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def _romanise_words(words, systems, errors, options):
+    results = []
+    for word in words:
+        try:
+            romanised = romanise_all(word, systems, **options)
+            results.append([romanised[system] for system in systems])
+        except (ValueError, IndexError, TypeError):
+            if errors == "strict":
+                raise
+            results.append(None)
+    return results
+
+
+def build_lexicon(words, path: str, systems=("rr",), errors: str = "strict", workers: int = 1,
+                  chunk_size: int = 1000, **options):
+    # Romanises the distinct strings of the iterable "words" in "systems" and writes the lexicon to "path".
+    # errors - "strict" raises on words romanise cannot handle, "skip" leaves them out
+    # workers - number of processes romanising chunks of "chunk_size" words, None for one per CPU
+    # Returns the number of words written.
+    if errors not in {"strict", "skip"}:
+        raise ValueError("Unknown error handling " + errors + ", expected strict or skip.")
+    systems = [system_lookup[system_lookup.index(system)] for system in systems]
+    words = sorted(set(words), key=lambda word: word.encode("utf-8"))
+    romanise_chunk = partial(_romanise_words, systems=systems, errors=errors, options=options)
+    results = map(romanise_chunk, ([word] for word in words)) if workers == 1 else \
+        ([result] for result in map_chunks(romanise_chunk, words, workers, chunk_size))
+
+    key_offsets, value_offsets = array("I", [0]), array("I", [0])
+    with tempfile.TemporaryFile() as keys, tempfile.TemporaryFile() as values:
+        for word, (romanisations,) in zip(words, results):
+            if romanisations is None:
+                continue
+            key_offsets.append(key_offsets[-1] + keys.write(word.encode("utf-8")))
+            if key_offsets[-1] > offset_limit:
+                raise ValueError("The words do not fit in a lexicon file.")
+            for romanisation in romanisations:
+                end = value_offsets[-1] + values.write(romanisation.encode("utf-8"))
+                if end > offset_limit:
+                    raise ValueError("The romanisations do not fit in a lexicon file.")
+                value_offsets.append(end)
+
+        metadata = json.dumps({"systems": systems, "options": options}, ensure_ascii=False).encode("utf-8")
+        count = len(key_offsets) - 1
+        with open(path, "wb") as output:
+            output.write(magic + _little_endian(array("I", [len(metadata)])) + metadata + _padding(len(metadata)))
+            output.write(_little_endian(array("I", [count])) + _little_endian(key_offsets) +
+                         _little_endian(value_offsets))
+            for blob, size in ((keys, key_offsets[-1]), (values, value_offsets[-1])):
+                blob.seek(0)
+                shutil.copyfileobj(blob, output)
+                output.write(_padding(size))
+    return count
+
+
+class Lexicon:
+    # Read-only view of a lexicon file written by build_lexicon.
+    # fallback - romanise words and systems missing from the lexicon instead of raising KeyError
+
+    def __init__(self, path: str, fallback: bool = True):
+        self.path, self.fallback = path, fallback
+        self.hits = self.misses = 0
+        with open(path, "rb") as source:
+            self._map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:8] != magic:
+            self._map.close()
+            raise ValueError(path + " is not a ko_pron lexicon.")
+        position = 12 + self._integers(8, 1)[0]
+        metadata = json.loads(self._map[12:position].decode("utf-8"))
+        self.systems, self.options = metadata["systems"], metadata["options"]
+        self._system_ids = {system: system_id for system_id, system in enumerate(self.systems)}
+        position += -position % 4
+        self._count = count = self._integers(position, 1)[0]
+        self._key_offsets = self._integers(position + 4, count + 1)
+        position += 4 + 4 * (count + 1)
+        self._value_offsets = self._integers(position, count * len(self.systems) + 1)
+        self._keys = position + 4 * (count * len(self.systems) + 1)
+        self._values = self._keys + self._key_offsets[count] + -self._key_offsets[count] % 4
+
+    def _integers(self, position, count):
+        view = memoryview(self._map)[position:position + 4 * count]
+        if sys.byteorder == "little":
+            return view.cast("I")
+        integers = array("I", view)
+        integers.byteswap()
+        return integers
+
+    def _find(self, word):
+        # Returns the index of "word" in the sorted keys, or -1
+        key, keys, offsets = word.encode("utf-8"), self._keys, self._key_offsets
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            found = self._map[keys + offsets[middle]:keys + offsets[middle + 1]]
+            if found < key:
+                low = middle + 1
+            elif found > key:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def get(self, word: str, system: str, default=None):
+        # Returns the stored romanisation of "word" in "system", or "default"
+        system_id = self._system_ids.get(system)
+        index = self._find(word) if system_id is not None else -1
+        if index == -1:
+            return default
+        value = index * len(self.systems) + system_id
+        start, end = self._values + self._value_offsets[value], self._values + self._value_offsets[value + 1]
+        return self._map[start:end].decode("utf-8")
+
+    def lookup(self, word: str, system: str):
+        # Returns the romanisation of "word" in "system", from the lexicon or romanised on a miss
+        romanisation = self.get(word, system)
+        if romanisation is not None:
+            self.hits += 1
+            return romanisation
+        self.misses += 1
+        if not self.fallback:
+            raise KeyError(word)
+        return romanise(word, system, **self.options)
+
+    def __contains__(self, word):
+        return self._find(word) != -1
+
+    def __len__(self):
+        return self._count
+
+    def words(self):
+        # Yields the words of the lexicon in sorted order
+        for index in range(self._count):
+            start, end = self._keys + self._key_offsets[index], self._keys + self._key_offsets[index + 1]
+            yield self._map[start:end].decode("utf-8")
+
+    def close(self):
+        self._key_offsets = self._value_offsets = None
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def __getstate__(self):
+        # Worker processes reopen the file and share its pages with the parent
+        return self.path, self.fallback
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(prog="python -m ko_pron.lexicon",
+                                     description="Build or query a prebuilt romanisation lexicon.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="romanise a word list, one word per line, into a lexicon")
+    build.add_argument("words", help="word list, stdin when -")
+    build.add_argument("-o", "--output", required=True, help="lexicon file to write")
+    build.add_argument("-s", "--systems", nargs="+", choices=system_lookup, default=["rr"])
+    build.add_argument("--cap", action="store_true", help="capitalise the romanisations")
+    build.add_argument("--errors", choices=["strict", "skip"], default="strict",
+                       help="fail on words that cannot be romanised or leave them out")
+    build.add_argument("-j", "--workers", type=int, default=1, help="worker processes, 0 for one per CPU")
+    lookup = commands.add_parser("lookup", help="print the romanisations of words")
+    lookup.add_argument("lexicon", help="lexicon file")
+    lookup.add_argument("words", nargs="+")
+    lookup.add_argument("-s", "--system", help="system, the first one of the lexicon by default")
+    args = parser.parse_args(arguments)
+
+    if args.command == "build":
+        source = sys.stdin if args.words == "-" else open(args.words, encoding="utf-8")
+        with source:
+            words = [line.strip() for line in source if line.strip()]
+        options = {"cap": True} if args.cap else {}
+        count = build_lexicon(words, args.output, args.systems, args.errors, args.workers or None, **options)
+        print("{} words, {} bytes".format(count, os.path.getsize(args.output)))
+    else:
+        with Lexicon(args.lexicon) as lexicon:
+            for word in args.words:
+                print(word + "\t" + lexicon.lookup(word, args.system or lexicon.systems[0]))
+
+
+if __name__ == '__main__':
+    main()
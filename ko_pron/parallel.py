@@ -0,0 +1,42 @@
+# Ordered chunked execution on a process pool.
+#
+# Work is sent to the workers in chunks so that pickling and IPC are paid once per chunk rather than
+# once per item, and at most two chunks per worker are in flight so that memory stays bounded on
+# arbitrarily long inputs. With a single worker everything runs in the calling process.
+
+import os
+from collections import deque
+from itertools import islice
+
+
+def chunks(items, chunk_size: int):
+    # Yields lists of up to "chunk_size" consecutive items of the iterable "items"
+    items = iter(items)
+    chunk = list(islice(items, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(items, chunk_size))
+
+
+def map_chunks(function, items, workers: int = None, chunk_size: int = 1000):
+    # Yields the items of function(chunk) for consecutive chunks of "items", in input order.
+    # "function" must be picklable (a module level function or a functools.partial of one) and return a
+    # list for every chunk. "workers" defaults to the number of CPUs.
+    workers = workers or os.cpu_count() or 1
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("Workers and chunk size must be positive.")
+    if workers == 1:
+        for chunk in chunks(items, chunk_size):
+            yield from function(chunk)
+        return
+
+    # imported here as multiprocessing roughly doubles the import time of ko_pron
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for chunk in chunks(items, chunk_size):
+            pending.append(executor.submit(function, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,58 @@
+# Romanisation specialised for one system and one set of optional parameters.
+#
+# romanise resolves the system and normalises the options on every call, and its junction walk tests the
+# system index at every syllable. A Romaniser does this once when it is built: the vowel and junction
+# columns of its system are the compiled tables of its transducer, and its post-pass, separator, IPA
+# tidying and capitalisation are bound callables. Words with the positional parameters l, com, nn, ni or
+# bcred, or with characters the transducer does not handle, go through the general junction walk.
+# Results are the same as romanise's; the romanisation cache and instrumentation are not used.
+
+from .ko_pron import system_list, system_lookup, marker_pattern, post_passes, tidy_ipa, _normalise_options, \
+    _split_runs, _run_respellings, _romanise_run
+
+
+class Romaniser:
+    # The compiled path only covers romanisations without positional parameters: with l, com, nn, ni or bcred
+    # every run takes the slow path of romanise's junction walk, and a Romaniser is no faster than romanise
+
+    def __init__(self, system_index, **options):
+        # system_index - abbreviation of the system as for romanise, options - the optional parameters of romanise
+        self.system = system_index
+        self.system_index = system_lookup.index(system_index)
+        self.options = _normalise_options(**options)
+        l, cap, com, nn, ui, ui_e, nobc, ni, bcred, svar, iot, yeored, max_variants = self.options
+        self._respelling_options = (ui, ui_e, nobc, svar, iot, yeored)
+        self._max_variants = max_variants
+        self._separator = system_list[self.system_index]["separator"]
+        self._post_pass = post_passes[self.system_index]
+        self._capitalise = cap and self.system_index not in {0, 5}
+        self._tidy = self.system_index == 5 and tidy_ipa or None
+        from .transducer import transducer
+        self._transduce = not (l or com or nn or ni) and bcred is None and transducer(self.system_index).transduce \
+            or None
+
+    def __call__(self, text: str):
+        runs, tail = _split_runs(marker_pattern.sub("\\1", text))
+        pieces = []
+        for gap, run in runs:
+            pieces += gap, self._romanise_run(run)
+        pieces.append(tail)
+        return "".join(pieces)
+
+    def _romanise_run(self, word):
+        respellings = _run_respellings(word, (self.system_index,), *self._respelling_options,
+                                       self._max_variants)[self.system_index]
+        transduce, post_pass, capitalise = self._transduce, self._post_pass, self._capitalise
+        romanisations = []
+        for respelling in respellings:
+            romanisation = transduce and transduce(respelling)
+            if romanisation is None:
+                return _romanise_run(word, (self.system_index,), *self.options)[self.system_index]
+            if capitalise:
+                romanisation = romanisation[0].upper() + romanisation[1:]
+            romanisations.append(post_pass(word, romanisation))
+        text = self._separator.join(romanisations)
+        return self._tidy(text) if self._tidy else text
+
+    def __repr__(self):
+        return "Romaniser({!r})".format(self.system)
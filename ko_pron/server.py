@@ -0,0 +1,194 @@
+# Local JSON romanisation service over HTTP, on a TCP port or a Unix socket.
+#
+#   POST /romanise        {"text": "있다", "system": "mr", "options": {"cap": true}}  ->  {"romanisation": "Itta"}
+#   POST /romanise_many   {"texts": ["있다", "한국어"], "system": "mr"}  ->  {"romanisations": ["itta", "han'gugŏ"]}
+#   GET  /stats           request and error counts, latency percentiles, coalesced lookups and cache statistics
+#                         of the server process (worker processes keep their own caches)
+#
+# Only the subset of HTTP/1.1 needed by local clients is implemented: requests with a Content-Length body
+# and persistent connections. Usage: python -m ko_pron.server [--port 8000 | --unix /tmp/ko_pron.sock]
+
+import argparse
+import asyncio
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+from .aio import AsyncRomaniser
+from .instrumentation import percentile
+from .ko_pron import set_cache_size, cache_info
+
+status_reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                  413: "Payload Too Large", 500: "Internal Server Error"}
+max_body_size = 16 * 1024 * 1024
+
+
+class LatencyStats:
+    # Request count and latency percentiles of the last "window" requests of every endpoint
+
+    def __init__(self, window: int = 10000):
+        self.window = window
+        self.requests, self.errors, self._latencies = {}, {}, {}
+
+    def record(self, endpoint: str, seconds: float, failed: bool = False):
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        if failed:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+        latencies.append(seconds)
+
+    def snapshot(self):
+        endpoints = {}
+        for endpoint, latencies in self._latencies.items():
+            ordered = sorted(latencies)
+            endpoints[endpoint] = {"requests": self.requests[endpoint], "errors": self.errors.get(endpoint, 0)}
+            for name, fraction in (("p50_ms", 0.5), ("p90_ms", 0.9), ("p99_ms", 0.99)):
+                endpoints[endpoint][name] = round(percentile(ordered, fraction) * 1000, 3)
+        return endpoints
+
+
+class RomanisationServer:
+
+    def __init__(self, romaniser: AsyncRomaniser = None):
+        self.romaniser = romaniser or AsyncRomaniser()
+        self.stats = LatencyStats()
+
+    async def handle(self, method: str, path: str, body: bytes):
+        # Returns the status and the JSON document answering one request
+        endpoint = self._endpoints.get(path)
+        if endpoint is None:
+            return 404, {"error": "Unknown endpoint " + path + "."}
+        expected_method, function = endpoint
+        if method != expected_method:
+            return 405, {"error": path + " expects " + expected_method + "."}
+        start = perf_counter()
+        try:
+            status, document = 200, await function(self, body)
+        except (ValueError, IndexError, TypeError, KeyError) as error:
+            status, document = 400, {"error": "{}: {}".format(type(error).__name__, error)}
+        except Exception as error:
+            # e.g. a broken worker pool: answer and count the failure instead of dropping the connection
+            status, document = 500, {"error": "{}: {}".format(type(error).__name__, error)}
+        self.stats.record(path, perf_counter() - start, status != 200)
+        return status, document
+
+    async def _romanise(self, body):
+        request = _request(body)
+        return {"romanisation": await self.romaniser.romanise(_string(request, "text"), request.get("system", "rr"),
+                                                              **request.get("options", {}))}
+
+    async def _romanise_many(self, body):
+        request = _request(body)
+        texts = request["texts"]
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise TypeError("texts must be a list of strings.")
+        return {"romanisations": await self.romaniser.romanise_many(texts, request.get("system", "rr"),
+                                                                    **request.get("options", {}))}
+
+    async def _stats(self, body):
+        cache = cache_info()
+        return {"endpoints": self.stats.snapshot(), "computed": self.romaniser.computed,
+                "coalesced": self.romaniser.coalesced, "in_flight": self.romaniser.in_flight(),
+                "cache": cache._asdict() if cache is not None else None}
+
+    _endpoints = {"/romanise": ("POST", _romanise), "/romanise_many": ("POST", _romanise_many),
+                  "/stats": ("GET", _stats)}
+
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # Answers the requests of one connection until the client closes it or asks to
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode("latin-1").strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > max_body_size:
+                    await self._respond(writer, 413, {"error": "Request body too large."}, False)
+                    break
+                body = await reader.readexactly(length)
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                status, document = await self.handle(method, path.partition("?")[0], body)
+                await self._respond(writer, status, document, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, document, keep_alive):
+        payload = json.dumps(document, ensure_ascii=False).encode("utf-8")
+        writer.write("HTTP/1.1 {} {}\r\nContent-Type: application/json; charset=utf-8\r\nContent-Length: {}\r\n"
+                     "Connection: {}\r\n\r\n".format(status, status_reasons[status], len(payload),
+                                                     keep_alive and "keep-alive" or "close").encode("latin-1"))
+        writer.write(payload)
+        await writer.drain()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000, path: str = None):
+        # Starts listening on "path" if given, a Unix socket, or else on "host" and "port".
+        # Returns the asyncio.Server.
+        if path is not None:
+            return await asyncio.start_unix_server(self.serve_connection, path)
+        return await asyncio.start_server(self.serve_connection, host, port)
+
+
+def _request(body):
+    request = json.loads(body.decode("utf-8") or "{}")
+    if not isinstance(request, dict):
+        raise TypeError("The request must be a JSON object.")
+    if not isinstance(request.get("options", {}), dict):
+        raise TypeError("options must be a JSON object.")
+    return request
+
+
+def _string(request, name):
+    value = request[name]
+    if not isinstance(value, str):
+        raise TypeError(name + " must be a string.")
+    return value
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8000, path: str = None, workers: int = 0):
+    # Runs the server until cancelled. "workers" processes romanise the requests, 0 for a thread of the
+    # event loop process.
+    executor = ProcessPoolExecutor(workers) if workers else None
+    server = await RomanisationServer(AsyncRomaniser(executor)).start(host, port, path)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(prog="python -m ko_pron.server",
+                                     description="Serve romanisation as JSON over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("-p", "--port", type=int, default=8000, help="TCP port to listen on")
+    parser.add_argument("--unix", help="Unix socket path to listen on instead of a TCP port")
+    parser.add_argument("-j", "--workers", type=int, default=0, help="worker processes, 0 for a worker thread")
+    parser.add_argument("--cache", type=int, default=0, help="size of the LRU cache of romanised runs")
+    args = parser.parse_args(arguments)
+
+    set_cache_size(args.cache)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# Line-oriented romanisation of large inputs.
+#
+# Lines are read lazily and written in chunks, so memory use does not depend on the size of the input.
+# As with romanise, only the runs of Hangul are romanised and everything else on a line is copied unchanged.
+
+import json
+from functools import partial
+
+from .ko_pron import system_lookup, _normalise_options, _romanise_cached
+from .parallel import map_chunks
+
+formats = ("text", "tsv", "jsonl")
+
+
+def romanise_stream(lines, system_index, input_format: str = "text", column: int = 0, field: str = "text",
+                    errors: str = "strict", workers: int = 1, chunk_size: int = 256, **options):
+    # Yields the romanisation of every line of the iterable "lines", keeping line endings.
+    # input_format - "text": the whole line is romanised
+    #                "tsv": the tab separated field number "column" is romanised and appended as a new last field
+    #                "jsonl": the "field" value of every JSON object is romanised and stored under the system name
+    # errors - "strict" raises on text romanise cannot handle, with the 1-based number of the failing line as
+    #          the "line_number" attribute of the error; "keep" leaves such text unchanged, and with "jsonl"
+    #          also lines that are not JSON objects
+    # workers - number of processes converting chunks of "chunk_size" lines, None for one per CPU
+    if input_format not in formats:
+        raise ValueError("Unknown format " + input_format + ", expected one of: " + ", ".join(formats) + ".")
+    if errors not in {"strict", "keep"}:
+        raise ValueError("Unknown error handling " + errors + ", expected strict or keep.")
+    convert = partial(_convert_line, system_name=system_index, system_index=system_lookup.index(system_index),
+                      input_format=input_format, column=column, field=field, errors=errors,
+                      options=_normalise_options(**options))
+    convert = partial(_convert_numbered_line, convert=convert)
+    if workers == 1:
+        return map(convert, enumerate(lines, 1))
+    return map_chunks(partial(_convert_lines, convert=convert), enumerate(lines, 1), workers, chunk_size)
+
+
+def _convert_lines(numbered_lines, convert):
+    return [convert(numbered_line) for numbered_line in numbered_lines]
+
+
+def _convert_numbered_line(numbered_line, convert):
+    # The line number travels on the error, which keeps its attributes when it is pickled back from a worker
+    number, line = numbered_line
+    try:
+        return convert(line)
+    except (ValueError, IndexError, TypeError) as error:
+        error.line_number = number
+        raise
+
+
+def _convert_line(line, system_name, system_index, input_format, column, field, errors, options):
+    body = line.rstrip("\r\n")
+    ending = line[len(body):]
+    if input_format == "text":
+        body = _convert_text(body, system_index, errors, options)
+    elif input_format == "tsv":
+        fields = body.split("\t")
+        body = body + "\t" + (_convert_text(fields[column], system_index, errors, options)
+                               if column < len(fields) else "")
+    elif body.strip():
+        try:
+            record = json.loads(body)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            if errors == "strict":
+                raise ValueError("Line is not a JSON object: " + (body[:60] + "..." if len(body) > 60 else body))
+            return line
+        record[system_name] = _convert_text(record.get(field, ""), system_index, errors, options)
+        body = json.dumps(record, ensure_ascii=False)
+    return body + ending
+
+
+def _convert_text(text, system_index, errors, options):
+    try:
+        return _romanise_cached(text, system_index, options)
+    except (ValueError, IndexError, TypeError):
+        if errors == "strict":
+            raise
+        return text
+
+
+def romanise_file(source, destination, system_index, chunk_lines: int = 1024, **stream_options):
+    # Romanises the lines of the text file object "source" into the text file object "destination".
+    # Output is buffered and written every "chunk_lines" lines. Returns the number of lines written.
+    # If a line fails, the lines converted before it are still written.
+    count, chunk = 0, []
+    try:
+        for line in romanise_stream(source, system_index, **stream_options):
+            chunk.append(line)
+            if len(chunk) >= chunk_lines:
+                destination.write("".join(chunk))
+                count += len(chunk)
+                chunk = []
+    finally:
+        destination.write("".join(chunk))
+        destination.flush()
+    return count + len(chunk)
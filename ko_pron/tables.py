@@ -0,0 +1,54 @@
+# Optional on-disk cache of tables derived from the data modules.
+#
+# Tables that take milliseconds to derive (the compiled transducers) can be stored with marshal in a cache
+# directory and loaded from it by later processes, which suits short-lived CLI and serverless invocations.
+# The cache is off unless the KO_PRON_TABLE_CACHE environment variable or set_table_cache names a directory.
+# Files are keyed on the Python version and on the size and modification time of the package sources, so
+# editing the data or upgrading Python never loads stale tables. Unreadable or unwritable files are ignored.
+
+import marshal
+import os
+import sys
+import zlib
+
+table_cache = os.environ.get("KO_PRON_TABLE_CACHE") or None
+
+
+def set_table_cache(directory: str = None):
+    # Stores and loads derived tables in "directory", None disables the cache
+    global table_cache
+    table_cache = directory
+
+
+def _fingerprint():
+    package = os.path.dirname(__file__)
+    stamps = []
+    for name in ("data.py", "jamo.py", "junction.py", "transducer.py"):
+        try:
+            status = os.stat(os.path.join(package, name))
+        except OSError:
+            continue
+        stamps.append("{:x}-{:x}".format(status.st_size, status.st_mtime_ns))
+    return "{}{}-{:08x}".format(*sys.version_info[:2], zlib.crc32(" ".join(stamps).encode("ascii")))
+
+
+def cached_table(name: str, build):
+    # Returns build(), a value marshal can store, from the table cache when possible
+    if table_cache is None:
+        return build()
+    path = os.path.join(table_cache, "ko_pron-{}-{}.marshal".format(name, _fingerprint()))
+    try:
+        with open(path, "rb") as source:
+            return marshal.load(source)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    table = build()
+    try:
+        os.makedirs(table_cache, exist_ok=True)
+        temporary = "{}.{}.tmp".format(path, os.getpid())
+        with open(temporary, "wb") as output:
+            marshal.dump(table, output)
+        os.replace(temporary, path)
+    except OSError:
+        pass
+    return table
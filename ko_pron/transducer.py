@@ -0,0 +1,146 @@
+# Table-driven romanisation engine for words without positional options.
+#
+# Without l, com, nn, ni and bcred, the junction between two syllables only depends on the final of the
+# first one (after the 넓 and 밟 special cases) and on the initial of the second one (plus whether it is
+# 이 or 히 for palatalisation, or ᄃ before ᅡ/ᅵ for 넓). Each system is compiled into a deterministic
+# transducer: the state is the final class of the previous syllable, the input symbol is the junction class
+# of the next syllable, and every step outputs the junction followed by the vowel of the next syllable.
+# The states and the input symbols are the same for every system, only the outputs differ, so transduce_all
+# walks a word once and maps the steps to the outputs of each system.
+
+from .data import vowels
+from .jamo import HANGUL_FIRST, HANGUL_COUNT, initial_jamo, vowel_jamo, final_jamo, syllable_table
+from .junction import finals, junction_row
+from .tables import cached_table
+
+# states: the finals of the boundary table ("" before the first syllable and after a space, "Ø" for no
+# final), 넓, whose final depends on the next syllable in phonetic Hangul and IPA, and 밟, whose final is ᆸ
+# outside Yale and WT-revised Revised Romanisation
+states = finals + ("넓", "밟")
+state_ids = {state: state_id for state_id, state in enumerate(states)}
+START = state_ids[""]
+
+# junction classes of the next syllable: its initial, or one of the special cases below
+END, DA, I, HI = range(len(initial_jamo), len(initial_jamo) + 4)
+class_initials = initial_jamo + ("Ø", "ᄃ", "ᄋ", "ᄒ")
+class_count = len(class_initials)
+
+
+def _syllable_classes():
+    # The junction class of a syllable is the index of its initial except for 이, 히, 다 and 디 (all finals)
+    classes = bytearray(initial_id for initial_id in range(len(initial_jamo)) for _ in range(588))
+    for vowel in ("ᅡ", "ᅵ"):
+        first = initial_jamo.index("ᄃ") * 588 + vowel_jamo.index(vowel) * 28
+        classes[first:first + 28] = bytes([DA]) * 28
+    classes[ord("이") - HANGUL_FIRST], classes[ord("히") - HANGUL_FIRST] = I, HI
+    return bytes(classes)
+
+
+syllable_classes = _syllable_classes()
+
+
+def _syllable_states():
+    # The state after a syllable is its final except for 넓 and 밟
+    final_states = bytes(state_ids[final or "Ø"] for final in final_jamo)
+    next_states = bytearray(final_states * (HANGUL_COUNT // 28))
+    for syllable in ("넓", "밟"):
+        next_states[ord(syllable) - HANGUL_FIRST] = state_ids[syllable]
+    return bytes(next_states)
+
+
+syllable_states = _syllable_states()
+# output index of a space or an apostrophe, after those of the syllables
+SPACE = HANGUL_COUNT
+
+
+class Transducer:
+    # Compiled romanisation of one system, see transducer()
+
+    def __init__(self, system_index: int):
+        self.system_index = system_index
+        self.vowels, self.junctions = cached_table("transducer-{}".format(system_index), self._compile)
+
+    def _compile(self):
+        return (tuple(self._vowel(chr(HANGUL_FIRST + offset)) for offset in range(HANGUL_COUNT)) + (" ",),
+                tuple(self._junction(state, junction_class)
+                      for state in states for junction_class in range(class_count)))
+
+    def _vowel(self, syllable):
+        initial, vowel, final = syllable_table[ord(syllable) - HANGUL_FIRST]
+        if self.system_index == 4 and vowel == "ᅮ" and initial in {"ᄆ", "ᄇ", "ᄈ", "ᄑ"}:
+            vowel = "ᅳ"
+        if self.system_index in {0, 5} and vowel == "ᅴ" and syllable != "의":
+            vowel = "ᅵ"
+        return vowels[vowel][self.system_index]
+
+    def _junction(self, state, junction_class):
+        next_initial = class_initials[junction_class]
+        final = state
+        if state == "넓":
+            final = self.system_index in {0, 5} and \
+                (next_initial in {"ᄌ", "ᄉ"} or junction_class == initial_jamo.index("ᄃ")) and "ᆸ" or "ᆲ"
+        elif state == "밟":
+            final = self.system_index not in {2, 4} and "ᆸ" or "ᆲ"
+        if self.system_index not in {2, 4} and junction_class in {I, HI}:
+            if final in {"ᇀ", "ᆴ"}:
+                final = "ᆾ"
+            elif final == "ᆮ":
+                final = junction_class == I and "ᆽ" or "ᆾ"
+        return junction_row(final, next_initial)[self.system_index]
+
+    def transduce(self, word: str):
+        # Returns the romanisation of "word" before the post-passes, or None if "word" has characters other
+        # than precomposed syllables, spaces and apostrophes
+        vowel_outputs, next_states, junctions, classes = self.vowels, syllable_states, self.junctions, syllable_classes
+        state, pieces = START, []
+        for character in word:
+            offset = ord(character) - HANGUL_FIRST
+            if 0 <= offset < HANGUL_COUNT:
+                pieces += junctions[state * class_count + classes[offset]], vowel_outputs[offset]
+                state = next_states[offset]
+            elif character == " " or character == "'":
+                pieces += junctions[state * class_count + END], " "
+                state = START
+            else:
+                return None
+        pieces.append(junctions[state * class_count + END])
+        return "".join(pieces)
+
+
+def transduce_all(word: str, system_indexes):
+    # Returns {system index: romanisation of "word" before the post-passes} for every system of
+    # "system_indexes", walking the word once, or None as Transducer.transduce
+    steps, outputs = [], []
+    state = START
+    for character in word:
+        offset = ord(character) - HANGUL_FIRST
+        if 0 <= offset < HANGUL_COUNT:
+            steps.append(state * class_count + syllable_classes[offset])
+            outputs.append(offset)
+            state = syllable_states[offset]
+        elif character == " " or character == "'":
+            steps.append(state * class_count + END)
+            outputs.append(SPACE)
+            state = START
+        else:
+            return None
+    last = state * class_count + END
+    romanisations = {}
+    for system_index in system_indexes:
+        compiled = _transducers.get(system_index) or transducer(system_index)
+        junctions, vowels = compiled.junctions, compiled.vowels
+        pieces = [junctions[step] + vowels[output] for step, output in zip(steps, outputs)]
+        pieces.append(junctions[last])
+        romanisations[system_index] = "".join(pieces)
+    return romanisations
+
+
+_transducers = {}
+
+
+def transducer(system_index: int):
+    # Returns the Transducer of a system index, compiling it on first use
+    compiled = _transducers.get(system_index)
+    if compiled is None:
+        compiled = _transducers[system_index] = Transducer(system_index)
+    return compiled
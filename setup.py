@@ -11,7 +11,8 @@ setuptools.setup(
     description="Korean pronunciation and romanisation based on Wiktionary ko-pron lua module",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=["benchmark", "benchmark.*"]),
+    extras_require={"numpy": ["numpy"]},
     license='MIT',
     keywords='hangul korean pronunciation romanisation romanization IPA Yale McCune-Reischauer WT-revised revised',
     classifiers=[
@@ -1,5 +1,5 @@
 #!/usr/bin/env bash
-COVERAGE_FILE=.coverage_params coverage run test_params.py
-COVERAGE_FILE=.coverage_pron coverage run test_pronunciation.py
-coverage combine .coverage_*
+# runs every test module from the repository root, so that the tests can import ko_pron and benchmark
+cd "$(dirname "$0")/.." || exit 1
+coverage run --source=ko_pron -m unittest discover -s test -p "test_*.py"
 coverage report
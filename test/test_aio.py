@@ -0,0 +1,93 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest import IsolatedAsyncioTestCase, TestCase, main
+
+from ko_pron import romanise
+from ko_pron import aio
+from ko_pron.aio import AsyncRomaniser, romanise_async, romanise_many_async
+
+
+class BlockingExecutor(ThreadPoolExecutor):
+    # Holds every job until "release" is set, so that lookups stay in flight
+    def __init__(self):
+        super().__init__(1)
+        self.release = Event()
+
+    def submit(self, function, *args):
+        return super().submit(lambda: self.release.wait() and function(*args))
+
+
+class TestAsyncRomaniser(IsolatedAsyncioTestCase):
+    async def test_same_results(self):
+        self.assertEqual(await romanise_async("있다", "mr", cap=True), romanise("있다", "mr", cap=True))
+        self.assertEqual(await romanise_many_async(["있다", "한국어", "있다"], "ipa"),
+                         [romanise(word, "ipa") for word in ["있다", "한국어", "있다"]])
+
+    async def test_coalescing(self):
+        executor = BlockingExecutor()
+        romaniser = AsyncRomaniser(executor)
+        lookups = asyncio.gather(romaniser.romanise("있다", "rr"), romaniser.romanise("있다", "rr"),
+                                 romaniser.romanise_many(["있다", "한국어"], "rr"), romaniser.romanise("있다", "mr"))
+        await asyncio.sleep(0)
+        self.assertEqual(romaniser.in_flight(), 3)
+        executor.release.set()
+        self.assertEqual(await lookups, ["itda", "itda", ["itda", "han-gugeo"], "itta"])
+        self.assertEqual((romaniser.computed, romaniser.coalesced, romaniser.in_flight()), (3, 2, 0))
+        executor.shutdown()
+
+    async def test_errors_only_fail_their_text(self):
+        romaniser = AsyncRomaniser()
+        with self.assertRaises(ValueError):
+            await romaniser.romanise_many(["있다", "가ㄱ"], "rr")
+        self.assertEqual(await romaniser.romanise("있다", "rr"), "itda")
+        with self.assertRaises(ValueError):
+            await romaniser.romanise("있다", "xx")
+        self.assertEqual(romaniser.in_flight(), 0)
+
+    async def test_cancelled_caller(self):
+        executor = BlockingExecutor()
+        romaniser = AsyncRomaniser(executor)
+        first = asyncio.ensure_future(romaniser.romanise("있다", "rr"))
+        second = asyncio.ensure_future(romaniser.romanise("있다", "rr"))
+        await asyncio.sleep(0)
+        first.cancel()
+        executor.release.set()
+        self.assertEqual(await second, "itda")
+        executor.shutdown()
+
+    async def test_first_error_in_input_order(self):
+        romaniser = AsyncRomaniser(chunk_size=1)
+        with self.assertRaisesRegex(ValueError, "ㄴ-Ø"):
+            await romaniser.romanise_many(["있다", "간ㄴ", "가ㄱ"], "rr")
+
+    async def test_unhashable_text(self):
+        romaniser = AsyncRomaniser()
+        with self.assertRaises(TypeError):
+            await romaniser.romanise_many(["있다", ["x"]], "rr")
+        self.assertEqual(romaniser.in_flight(), 0)
+        self.assertEqual(await asyncio.wait_for(romaniser.romanise("있다", "rr"), 5), "itda")
+
+    async def test_executor_refusing_jobs(self):
+        executor = ThreadPoolExecutor(1)
+        executor.shutdown()
+        romaniser = AsyncRomaniser(executor)
+        with self.assertRaises(RuntimeError):
+            await romaniser.romanise("있다", "rr")
+        self.assertEqual(romaniser.in_flight(), 0)
+        romaniser.executor = ThreadPoolExecutor(1)
+        self.assertEqual(await asyncio.wait_for(romaniser.romanise("있다", "rr"), 5), "itda")
+        romaniser.executor.shutdown()
+
+
+class TestDefaultRomaniser(TestCase):
+    def test_one_per_event_loop(self):
+        async def lookup():
+            return await romanise_async("있다", "rr"), aio._default_romaniser()
+        first, second = asyncio.run(lookup()), asyncio.run(lookup())
+        self.assertEqual((first[0], second[0]), ("itda", "itda"))
+        self.assertIsNot(first[1], second[1])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+from unittest import TestCase, main
+
+from ko_pron import romanise, romanise_many, romanise_all
+
+
+class TestRomaniseMany(TestCase):
+    words = ["한국어", "있다", "것인가", "공산주의", "깻잎"]
+
+    def test_matches_single_calls(self):
+        for system in ["ph", "rr", "rrr", "mr", "yr", "ipa"]:
+            with self.subTest(system=system):
+                self.assertEqual(romanise_many(self.words, system), [romanise(word, system) for word in self.words])
+
+    def test_shared_options(self):
+        self.assertEqual(romanise_many(iter(["한국어", "의견란"]), "yr", l=[0], nn=[2]),
+                         [romanise("한국어", "yr", l=[0], nn=[2]), romanise("의견란", "yr", l=[0], nn=[2])])
+
+    def test_errors_match_single_calls(self):
+        with self.assertRaises(ValueError):
+            romanise("가ㄱ", "rr")
+        with self.assertRaises(ValueError):
+            romanise_many(["있다", "가ㄱ"], "rr")
+
+    def test_empty(self):
+        self.assertEqual(romanise_many([], "rr"), [])
+
+    def test_unknown_system(self):
+        with self.assertRaises(ValueError):
+            romanise_many(["한국어"], "xx")
+
+
+class TestRomaniseAll(TestCase):
+    def test_all_systems(self):
+        self.assertEqual(romanise_all("한국어"), {"ph": "한구거",
+                                                "rr": "han-gugeo",
+                                                "rrr": "hangug-eo",
+                                                "mr": "han'gugŏ",
+                                                "yr": "hankwuk.e",
+                                                "ipa": "ha̠nɡuɡʌ̹"})
+
+    def test_selected_systems_with_options(self):
+        for word, options in [("공산주의", {"ui": 3, "l": [0]}),
+                              ("뛰어들다", {"iot": 1}),
+                              ("상사병", {"com": [1]}),
+                              ("깻잎", {"ni": [1]})]:
+            with self.subTest(word=word):
+                self.assertEqual(romanise_all(word, ["ipa", "ph", "yr"], **options),
+                                 {system: romanise(word, system, **options) for system in ["ipa", "ph", "yr"]})
+
+    def test_unknown_system(self):
+        with self.assertRaises(ValueError):
+            romanise_all("한국어", ["rr", "xx"])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+from unittest import TestCase, main
+
+from benchmark.corpus import option_cases, random_words
+from benchmark import helpers
+from benchmark.suite import compare, run
+from ko_pron import romanise
+
+
+class TestBenchmarkSuite(TestCase):
+    def test_corpora_are_deterministic(self):
+        self.assertEqual(random_words(20, seed=4), random_words(20, seed=4))
+        self.assertEqual(option_cases(20, seed=4), option_cases(20, seed=4))
+
+    def test_option_cases_are_accepted(self):
+        for word, options in option_cases(200):
+            for system in ["ph", "rr", "rrr", "mr", "yr", "ipa"]:
+                romanise(word, system, **options)
+
+    def test_compare(self):
+        results = run(["rr"], ["words"], scale=0.01, repeat=1)
+        measured = results["words"]["rr"]
+        self.assertEqual(compare(results, results), [])
+        faster = {"words": {"rr": dict(measured, syllables_per_second=measured["syllables_per_second"] * 2)}}
+        self.assertEqual(len(compare(results, faster)), 1)
+        grown = {"words": {"rr": dict(measured, peak_kb=measured["peak_kb"] + 60)}}
+        self.assertEqual(compare(grown, results, tolerance=0), [])
+        self.assertEqual(len(compare(grown, results, tolerance=0, memory_floor_kb=32)), 1)
+        larger = {"words": {"rr": dict(measured, peak_kb=1000)}}
+        smaller = {"words": {"rr": dict(measured, peak_kb=500)}}
+        self.assertEqual(len(compare(larger, smaller)), 1)
+        self.assertEqual(compare(results, {"text": {"rr": measured}}), [])
+
+    def test_helpers_compare(self):
+        results = helpers.run(20)
+        self.assertEqual(helpers.compare(results, results), [])
+        faster = {name: nanoseconds / 2 for name, nanoseconds in results.items()}
+        self.assertEqual(len(helpers.compare(results, faster)), len(results))
+        self.assertEqual(helpers.compare(results, {}), [])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+from unittest import TestCase, main
+
+from ko_pron import romanise, romanise_many, set_cache_size, cache_info
+from ko_pron.cache import LRUCache
+
+
+class TestRomanisationCache(TestCase):
+    def tearDown(self):
+        set_cache_size(None)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(cache_info())
+
+    def test_hits_and_misses(self):
+        set_cache_size(10)
+        self.assertEqual(romanise("있다", "mr"), "itta")
+        self.assertEqual(romanise("있다", "mr"), "itta")
+        self.assertEqual(romanise("있다", "rr"), "itda")
+        info = cache_info()
+        self.assertEqual((info.hits, info.misses, info.size, info.capacity), (1, 2, 2, 10))
+
+    def test_list_options_are_part_of_the_key(self):
+        long_vowel = romanise("한국어", "yr", l=[0])
+        set_cache_size(10)
+        self.assertEqual(romanise("한국어", "yr", l=[0]), long_vowel)
+        self.assertEqual(romanise("한국어", "yr"), "hankwuk.e")
+        self.assertEqual(romanise("한국어", "yr", l=(0,)), long_vowel)
+        self.assertEqual(cache_info().hits, 1)
+
+    def test_batch_uses_cache(self):
+        set_cache_size(10)
+        romanise_many(["한국어", "한국어", "있다"], "ipa")
+        self.assertEqual(cache_info()[:2], (1, 2))
+
+    def test_eviction(self):
+        set_cache_size(2)
+        for word in ["한국어", "있다", "것이다"]:
+            romanise(word, "rr")
+        info = cache_info()
+        self.assertEqual((info.evictions, info.size), (1, 2))
+
+
+class TestLRUCache(TestCase):
+    def test_least_recently_used_is_evicted(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+
+if __name__ == '__main__':
+    main()
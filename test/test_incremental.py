@@ -0,0 +1,52 @@
+from unittest import TestCase, main
+
+from ko_pron import romanise
+from ko_pron.incremental import IncrementalRomaniser, _common_prefix_length
+
+
+class TestIncrementalRomaniser(TestCase):
+    def test_typing_matches_romanise(self):
+        text = "한국어 is 좋다, 뛰어들다 공산주의"
+        for system in ["ph", "rr", "rrr", "mr", "yr", "ipa"]:
+            romaniser = IncrementalRomaniser(system, l=[0])
+            for end in range(1, len(text) + 1):
+                with self.subTest(system=system, text=text[:end]):
+                    self.assertEqual(romaniser.append(text[end - 1]), romanise(text[:end], system, l=[0]))
+
+    def test_delete(self):
+        romaniser = IncrementalRomaniser("ipa", "있다 한국어")
+        self.assertEqual(romaniser.delete(), romanise("있다 한국", "ipa"))
+        self.assertEqual(romaniser.delete(3), romanise("있다", "ipa"))
+        self.assertEqual(romaniser.delete(10), "")
+        self.assertEqual(romaniser.text, "")
+
+    def test_set_text(self):
+        romaniser = IncrementalRomaniser("mr", "것이다")
+        self.assertEqual(romaniser.set_text("것인가"), "kŏsin'ga")
+        self.assertEqual(str(romaniser), "kŏsin'ga")
+
+    def test_edits_anywhere(self):
+        text = "한국어 is 좋다, 뛰어들다 공산주의"
+        romaniser = IncrementalRomaniser("rr", text)
+        for edited in ["가" + text[1:], "가" + text[1:8] + "x" + text[9:], text[:-1] + "가", "", text]:
+            with self.subTest(text=edited):
+                self.assertEqual(romaniser.set_text(edited), romanise(edited, "rr"))
+
+    def test_variants(self):
+        romaniser = IncrementalRomaniser("ph", "뛰어", iot=1)
+        self.assertEqual(romaniser.append("들다"), "뛰어들다/뛰여들다")
+
+    def test_error_keeps_text(self):
+        romaniser = IncrementalRomaniser("rr", "가")
+        with self.assertRaises(ValueError):
+            romaniser.append("ㄱ")
+        self.assertEqual((romaniser.text, romaniser.romanisation), ("가", "ga"))
+
+    def test_common_prefix_length(self):
+        for first, second, length in [("", "", 0), ("가나", "", 0), ("가나다", "가나라", 2), ("가나", "가나다", 2),
+                                      ("가나", "가나", 2), ("x가", "가", 0)]:
+            self.assertEqual(_common_prefix_length(first, second), length)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import os
+import tempfile
+from unittest import TestCase, main
+
+from ko_pron import romanise
+from ko_pron.index import ReverseIndex, fold, variants
+
+
+class TestReverseIndex(TestCase):
+    words = ["한국어", "한국", "외계인", "있다", "한국어", "서울 사람"]
+
+    def test_exact(self):
+        index = ReverseIndex.build(self.words, ["rr", "mr"])
+        self.assertEqual(index.lookup("hangugeo"), ["한국어"])
+        self.assertEqual(index.lookup("han-gugeo"), ["한국어"])
+        self.assertEqual(index.lookup("HAN'GUGŎ"), ["한국어"])
+        self.assertEqual(index.lookup("han'gugŏ", systems=["rr"]), [])
+        self.assertEqual(index.lookup("seoul saram"), ["서울 사람"])
+        self.assertEqual(index.lookup("itta"), ["있다"])
+        self.assertEqual(index.lookup("hangu"), [])
+
+    def test_prefix(self):
+        index = ReverseIndex.build(self.words, ["rr"])
+        self.assertEqual(index.prefix("hang"), ["한국어", "한국"])
+        self.assertEqual(index.prefix("hang", limit=1), ["한국어"])
+        self.assertEqual(index.prefix("x"), [])
+        self.assertEqual(len(index.prefix("")), 5)
+
+    def test_variants(self):
+        self.assertEqual(variants("외계인 외계", ["rr"], ui=0)["rr"], ["oegyein oegye"])
+        phonetic = variants("외계 외", ["ph"])["ph"]
+        self.assertEqual(len(phonetic), len(set(phonetic)))
+        self.assertIn("웨게 웨", phonetic)
+        index = ReverseIndex.build(["외계"], ["ph", "ipa"])
+        self.assertEqual(index.lookup("웨게"), ["외계"])
+        self.assertEqual(index.lookup("ø̞ɡe̞"), ["외계"])
+
+    def test_variants_match_romanise(self):
+        for word in ["뒳", "의의", "쇠고기", "회의"]:
+            for system, separator in [("ph", "/"), ("rr", "/"), ("ipa", "] ~ [")]:
+                expected = list(dict.fromkeys(romanise(word, system, ui=0, svar=0).split(separator)))
+                self.assertEqual(variants(word, [system], ui=0, svar=0)[system], expected, (word, system))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            ReverseIndex.build(["가ㄱ"], ["rr"])
+        self.assertEqual(ReverseIndex.build(["가ㄱ", "가"], ["rr"], errors="skip").headwords, ["가"])
+
+    def test_save_and_load(self):
+        index = ReverseIndex.build(self.words, ["rr", "ipa"])
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ["index.json", "index.json.gz"]:
+                path = os.path.join(directory, name)
+                index.save(path)
+                loaded = ReverseIndex.load(path)
+                self.assertEqual((loaded.headwords, loaded.keys, loaded.headword_ids, loaded.system_indexes),
+                                 (index.headwords, index.keys, index.headword_ids, index.system_indexes))
+                self.assertEqual(loaded.lookup("oegyein"), ["외계인"])
+
+    def test_fold(self):
+        self.assertEqual(fold("Han-gug ŏ"), "hangugŏ")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+from unittest import TestCase, main
+
+from ko_pron import romanise, romanise_all, instrument, set_cache_size, set_engine
+from ko_pron import ko_pron
+
+
+class TestInstrumentation(TestCase):
+    def test_counts(self):
+        with instrument() as profile:
+            romanise("한국어 (Korean) 좋다", "rr")
+            romanise("외계", "ipa", ui=0)
+        self.assertEqual(profile.counts, {"texts": 2, "runs": 3, "variants": 10, "junctions": 26,
+                                          "regex_passes": 3})
+        self.assertTrue(all(seconds >= 0 for seconds in profile.seconds.values()))
+        self.assertGreater(profile.seconds["junctions"], 0)
+        self.assertGreaterEqual(profile.seconds["post_passes"], profile.seconds["tidy_ipa"])
+
+    def test_callback_per_text(self):
+        texts = []
+        with instrument(texts.append) as profile:
+            romanise_all("있다")
+            romanise("한국어", "rr")
+        self.assertEqual([text.counts["runs"] for text in texts], [1, 1])
+        self.assertEqual(texts[0].counts["variants"], 6)
+        self.assertEqual(sum(text.counts["junctions"] for text in texts), profile.counts["junctions"])
+
+    def test_disabled(self):
+        with instrument() as profile:
+            pass
+        romanise("한국어", "rr")
+        self.assertIsNone(ko_pron.instrumentation)
+        self.assertEqual(profile.counts["texts"], 0)
+
+    def test_cache_hits_are_not_counted(self):
+        set_cache_size(10)
+        try:
+            with instrument() as profile:
+                romanise("한국어", "rr")
+                romanise("한국어", "rr")
+            self.assertEqual(profile.counts["texts"], 1)
+        finally:
+            set_cache_size(None)
+
+    def test_engines_count_the_same_junctions(self):
+        # the second respelling of 가다 with svar is not handled by the transducer, which falls back
+        counts = []
+        try:
+            for engine in ["junction", "transducer"]:
+                set_engine(engine)
+                with instrument() as profile:
+                    romanise("가다", "ph", svar=0)
+                    romanise("한국어", "ipa")
+                counts.append(profile.counts["junctions"])
+        finally:
+            set_engine("junction")
+        self.assertEqual(counts, [10, 10])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+import unicodedata
+from unittest import TestCase, main, skipUnless
+
+from ko_pron import decompose_jamo, decompose_text, compose_text
+from ko_pron.jamo import decompose_array
+from ko_pron.ko_pron import decompose_syllable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestDecomposeJamo(TestCase):
+    def test_syllables(self):
+        for cp in range(0xAC00, 0xD7A4):
+            offset = cp - 0xAC00
+            expected = {'initial': chr(0x1100 + offset // 588),
+                        'vowel': chr(0x1161 + offset % 588 // 28),
+                        'final': offset % 28 and chr(0x11A7 + offset % 28) or ""}
+            self.assertEqual(decompose_jamo(chr(cp)), expected)
+
+    def test_jamo(self):
+        self.assertEqual(decompose_jamo("ᄀ"), {'initial': "ᄀ", 'vowel': "Ø", 'final': "Ø"})
+        self.assertEqual(decompose_jamo("ᅡ"), {'initial': "Ø", 'vowel': "ᅡ", 'final': "Ø"})
+        self.assertEqual(decompose_jamo("ᆨ"), {'initial': "Ø", 'vowel': "Ø", 'final': "ᆨ"})
+        self.assertEqual(decompose_jamo("ㄱ"), {'initial': "Ø", 'vowel': "Ø", 'final': "ㄱ"})
+
+    def test_non_hangul(self):
+        for character in [" ", "'", "a", "", "ab"]:
+            with self.subTest(character=character):
+                self.assertEqual(decompose_jamo(character), {'initial': "Ø", 'vowel': " ", 'final': "X"})
+
+    def test_fresh_dict(self):
+        decompose_jamo("가")['final'] = "ᆨ"
+        self.assertEqual(decompose_jamo("가")['final'], "")
+
+    def test_decompose_syllable_shares_tuples(self):
+        syllables = decompose_syllable("가가a")
+        self.assertEqual(syllables, [("ᄀ", "ᅡ", ""), ("ᄀ", "ᅡ", ""), ("Ø", " ", "X")])
+        self.assertIs(syllables[0], syllables[1])
+
+
+class TestBulkConversion(TestCase):
+    def test_all_syllables(self):
+        syllables = "".join(map(chr, range(0xAC00, 0xD7A4)))
+        jamo = decompose_text(syllables)
+        self.assertEqual(jamo, unicodedata.normalize("NFD", syllables))
+        self.assertEqual(compose_text(jamo), syllables)
+
+    def test_flat_jamo(self):
+        self.assertEqual(decompose_text("한국어"), "\u1112\u1161\u11ab\u1100\u116e\u11a8\u110b\u1165")
+        self.assertEqual(compose_text("\u1112\u1161\u11ab\u1100\u116e\u11a8\u110b\u1165"), "한국어")
+
+    def test_other_characters_unchanged(self):
+        # Latin with combining marks, compatibility jamo, lone conjoining jamo and a conjoining sequence
+        for text in ["", "café, e\u0301", "ㄱㅏ \u1100 \u1161 \u11a8", "\u1100\u1161\u11a8\u11a8"]:
+            with self.subTest(text=text):
+                self.assertEqual(decompose_text(text), text)
+        text = "café, e\u0301 ㄱㅏ \u1100 \u1161 \u11a8"
+        self.assertEqual(compose_text(text), text)
+        self.assertEqual(compose_text("\u1100\u1161\u11a8\u11a8 \u1100"), "\uac01\u11a8 \u1100")
+
+    def test_round_trip(self):
+        text = "한국어 is 좋다 (2024). 값이 ㄱ 읽다"
+        self.assertEqual(compose_text(decompose_text(text)), text)
+
+
+@skipUnless(numpy, "numpy is not installed")
+class TestDecomposeArray(TestCase):
+    def test_ids_and_offsets(self):
+        result = decompose_array(["한국어", "a가", ""])
+        self.assertEqual(result.initial.tolist(), [18, 0, 11, -1, 0])
+        self.assertEqual(result.vowel.tolist(), [0, 13, 4, -1, 0])
+        self.assertEqual(result.final.tolist(), [4, 1, 0, -1, 0])
+        self.assertEqual(result.offsets.tolist(), [0, 3, 5, 5])
+
+    def test_matches_decompose_jamo(self):
+        words = [chr(cp) * 2 for cp in range(0xAC00, 0xD7A4, 7)]
+        result = decompose_array(iter(words))
+        for position, word in zip(range(0, len(words) * 2, 2), words):
+            jamo = decompose_jamo(word[0])
+            self.assertEqual(chr(0x1100 + int(result.initial[position])), jamo['initial'])
+            self.assertEqual(chr(0x1161 + int(result.vowel[position])), jamo['vowel'])
+            self.assertEqual(result.final[position] and chr(0x11A7 + int(result.final[position])) or "",
+                             jamo['final'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+from unittest import TestCase, main
+
+from ko_pron import romanise
+from ko_pron.data import boundary
+from ko_pron.junction import junction_row
+
+
+class TestJunctionMatrix(TestCase):
+    def test_matches_boundary_table(self):
+        for bound, row in boundary.items():
+            final, initial = bound.split("-")
+            self.assertEqual(junction_row(final, initial), tuple(row))
+
+    def test_missing_combination(self):
+        with self.assertRaisesRegex(ValueError, "No boundary data for ㄱ-Ø."):
+            junction_row("ㄱ", "Ø")
+        with self.assertRaises(ValueError):
+            romanise("가ㄱ", "rr")
+
+    def test_apostrophe_after_space(self):
+        self.assertEqual(romanise("두 '듦", "ipa"), "tu  tɯm")
+
+
+if __name__ == '__main__':
+    main()
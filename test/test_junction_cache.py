@@ -0,0 +1,77 @@
+from unittest import TestCase, main
+
+from ko_pron import romanise, set_junction_cache_size, junction_cache_info
+from ko_pron.cache import JunctionMemo
+from ko_pron.ko_pron import system_lookup
+
+from benchmark.corpus import option_cases, random_words
+from benchmark.junction_cache import common_words, measure
+
+
+def romanise_each(word, **options):
+    # romanise_all runs the transducers, which do not use the junction cache
+    return [romanise(word, system, **options) for system in system_lookup]
+
+
+class TestJunctionCache(TestCase):
+    def tearDown(self):
+        set_junction_cache_size(None)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(junction_cache_info())
+
+    def test_shared_across_words(self):
+        set_junction_cache_size(100)
+        self.assertEqual(romanise("한국어", "rr"), "han-gugeo")
+        self.assertEqual(junction_cache_info()[:2], (0, 4))
+        # the word start and 한 before ㄱ are reused, 국 at the end of the word is not
+        self.assertEqual(romanise("한국", "rr"), "han-guk")
+        self.assertEqual(junction_cache_info()[:2], (2, 5))
+
+    def test_same_results(self):
+        words = random_words(300, seed=24)
+        expected = [romanise_each(word) for word in words]
+        set_junction_cache_size(64)
+        for _ in range(2):
+            self.assertEqual([romanise_each(word) for word in words], expected)
+        self.assertGreater(junction_cache_info().evictions, 0)
+
+    def test_same_results_with_options(self):
+        cases = option_cases(200, seed=24)
+        expected = [romanise_each(word, **options) for word, options in cases]
+        set_junction_cache_size(1000)
+        self.assertEqual([romanise_each(word, **options) for word, options in cases], expected)
+
+    def test_positional_options_are_part_of_the_key(self):
+        long_vowel = romanise("한국어", "yr", l=[0])
+        set_junction_cache_size(100)
+        self.assertEqual(romanise("한국어", "yr"), "hankwuk.e")
+        self.assertEqual(romanise("한국어", "yr", l=[0]), long_vowel)
+        self.assertEqual(romanise("한국어", "yr"), "hankwuk.e")
+
+    def test_common_words(self):
+        hit_ratio, _, _ = measure(common_words(), 65536)
+        self.assertGreater(hit_ratio, 0.1)
+        self.assertIsNone(junction_cache_info())
+
+
+class TestJunctionMemo(TestCase):
+    def test_emptied_when_full(self):
+        memo = JunctionMemo(2)
+        for key in "abc":
+            memo.put(key, key)
+        self.assertEqual((memo.data, memo.evictions), ({"c": "c"}, 2))
+
+    def test_hit_ratio(self):
+        memo = JunctionMemo(2)
+        self.assertEqual(memo.hit_ratio(), 0.0)
+        memo.lookups, memo.misses = 4, 1
+        self.assertEqual(memo.hit_ratio(), 0.75)
+
+    def test_capacity(self):
+        with self.assertRaises(ValueError):
+            JunctionMemo(0)
+
+
+if __name__ == '__main__':
+    main()
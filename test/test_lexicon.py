@@ -0,0 +1,78 @@
+import io
+import os
+import pickle
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase, main
+
+from ko_pron import romanise
+from ko_pron.lexicon import build_lexicon, Lexicon, main as lexicon_main
+
+
+class TestLexicon(TestCase):
+    words = ["한국어", "있다", "외계인", "a가", "서울 사람", "있다", "í"]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "words.lex")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_lookup(self):
+        self.assertEqual(build_lexicon(self.words, self.path, ["rr", "ipa"], cap=True), 6)
+        with Lexicon(self.path) as lexicon:
+            self.assertEqual((lexicon.systems, lexicon.options, len(lexicon)), (["rr", "ipa"], {"cap": True}, 6))
+            self.assertEqual(list(lexicon.words()), sorted(set(self.words)))
+            for word in set(self.words):
+                for system in ["rr", "ipa"]:
+                    self.assertEqual(lexicon.get(word, system), romanise(word, system, cap=True))
+            self.assertIn("외계인", lexicon)
+            self.assertNotIn("외계", lexicon)
+            self.assertIsNone(lexicon.get("외계", "rr"))
+            self.assertIsNone(lexicon.get("외계인", "mr"))
+            self.assertEqual(lexicon.lookup("외계", "rr"), "Oegye")
+            self.assertEqual(lexicon.lookup("외계인", "mr"), "Oegyein")
+            self.assertEqual((lexicon.hits, lexicon.misses), (0, 2))
+            self.assertEqual(lexicon.lookup("있다", "rr"), "Itda")
+            self.assertEqual(lexicon.hits, 1)
+
+    def test_no_fallback(self):
+        build_lexicon(["있다"], self.path)
+        with Lexicon(self.path, fallback=False) as lexicon:
+            self.assertEqual(lexicon.lookup("있다", "rr"), "itda")
+            with self.assertRaises(KeyError):
+                lexicon.lookup("한국어", "rr")
+
+    def test_empty_and_errors(self):
+        self.assertEqual(build_lexicon([], self.path), 0)
+        with Lexicon(self.path) as lexicon:
+            self.assertEqual((len(lexicon), lexicon.get("있다", "rr")), (0, None))
+        with self.assertRaises(ValueError):
+            build_lexicon(["가ㄱ"], self.path)
+        self.assertEqual(build_lexicon(["가ㄱ", "가"], self.path, errors="skip"), 1)
+        with open(self.path, "wb") as output:
+            output.write(b"not a lexicon")
+        with self.assertRaises(ValueError):
+            Lexicon(self.path)
+
+    def test_workers_and_pickling(self):
+        build_lexicon(self.words * 3, self.path, ["mr"], workers=2, chunk_size=2)
+        with Lexicon(self.path) as lexicon:
+            copy = pickle.loads(pickle.dumps(lexicon))
+            self.assertEqual(copy.get("한국어", "mr"), "han'gugŏ")
+            copy.close()
+
+    def test_command_line(self):
+        source = os.path.join(self.directory.name, "words.txt")
+        with open(source, "w", encoding="utf-8") as output:
+            output.write("한국어\n있다\n\n")
+        output = io.StringIO()
+        with redirect_stdout(output):
+            lexicon_main(["build", source, "-o", self.path, "-s", "mr", "yr"])
+            lexicon_main(["lookup", self.path, "한국어", "없다", "-s", "yr"])
+        self.assertEqual(output.getvalue().splitlines()[1:], ["한국어\thankwuk.e", "없다\tepsqta"])
+
+
+if __name__ == '__main__':
+    main()
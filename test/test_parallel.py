@@ -0,0 +1,41 @@
+from unittest import TestCase, main
+
+from ko_pron import romanise, romanise_many
+from ko_pron.parallel import chunks, map_chunks
+from ko_pron.stream import romanise_stream
+
+
+def double(chunk):
+    return [item * 2 for item in chunk]
+
+
+class TestParallel(TestCase):
+    words = ["한국어", "있다", "것인가", "공산주의", "깻잎", "의견란", "상사병"]
+
+    def test_chunks(self):
+        self.assertEqual(list(chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_map_chunks_keeps_order(self):
+        for workers in [1, 2]:
+            with self.subTest(workers=workers):
+                self.assertEqual(list(map_chunks(double, range(50), workers, 3)), [i * 2 for i in range(50)])
+
+    def test_map_chunks_invalid(self):
+        with self.assertRaises(ValueError):
+            list(map_chunks(double, range(5), 2, 0))
+
+    def test_romanise_many(self):
+        self.assertEqual(romanise_many(self.words, "ipa", workers=2, chunk_size=2, l=[0]),
+                         [romanise(word, "ipa", l=[0]) for word in self.words])
+
+    def test_stream(self):
+        lines = [word + "\n" for word in self.words]
+        self.assertEqual(list(romanise_stream(lines, "mr", workers=2, chunk_size=3)),
+                         [romanise(word, "mr") + "\n" for word in self.words])
+        with self.assertRaises(ValueError) as raised:
+            list(romanise_stream(lines + ["가ㄱ\n"], "mr", workers=2, chunk_size=3))
+        self.assertEqual(raised.exception.line_number, len(lines) + 1)
+
+
+if __name__ == '__main__':
+    main()
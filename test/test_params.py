@@ -184,6 +184,21 @@ class TestKoPron(TestCase):
             with self.subTest(result=result, expected=expected):
                 self.assertEqual(result, expected)
 
+    def test_max_variants(self):
+        for system, expected in {
+            "ph": "뛰어들다",
+            "ipa": "t͈ɥiʌ̹dɯɭda̠] ~ [t͈yjʌ̹dɯɭda̠",
+            "mr": "ttwiŏdŭlda",
+        }.items():
+            result = romanise("뛰어들다", system, iot=1, max_variants=2 if system == "ipa" else 1)
+
+            with self.subTest(result=result, expected=expected):
+                self.assertEqual(result, expected)
+
+    def test_invalid_max_variants(self):
+        with self.assertRaises(ValueError):
+            romanise("뛰어들다", "ipa", max_variants=0)
+
 
 if __name__ == '__main__':
     main()
@@ -14,6 +14,16 @@ class TestKoPron(TestCase):
     def test_kosida(self):
         self.assertEqual("kŏsida", mr_romanize("것이다"))
 
+    def test_text_between_hangul_runs_is_kept(self):
+        self.assertEqual("han'gugŏ (Korean) is chot'a, itta!", mr_romanize("한국어 (Korean) is 좋다, 있다!"))
+
+    def test_positions_are_relative_to_each_run(self):
+        expected = romanise("한국어", "yr", l=[0])
+        self.assertEqual(expected + "," + expected, romanise("한국어,한국어", "yr", l=[0]))
+
+    def test_regex_characters_in_text(self):
+        self.assertEqual("(ɰi) [ɰi]*", romanise("(의) [의]*", "ipa"))
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,38 @@
+from unittest import TestCase, main
+
+from ko_pron import romanise, Romaniser
+
+systems = ["ph", "rr", "rrr", "mr", "yr", "ipa"]
+texts = ["한국어", "외계인", "넓죽하다", "같이 가요", "의의", "한국어 (Korean) is 좋다, 있다!", "가ㄱ", "\"한-국"]
+
+
+def outcome(function, *arguments, **options):
+    # The result of the call, or the type of the error it raised
+    try:
+        return function(*arguments, **options)
+    except (ValueError, IndexError, TypeError) as error:
+        return type(error)
+
+
+class TestRomaniser(TestCase):
+    def test_matches_romanise(self):
+        for options in [{}, {"cap": True}, {"ui": 0, "svar": 1, "max_variants": 3}, {"l": [0], "com": [1]},
+                        {"nn": [1], "ni": [2]}, {"bcred": 0}]:
+            for system in systems:
+                romaniser = Romaniser(system, **options)
+                for text in texts:
+                    with self.subTest(system=system, options=options, text=text):
+                        self.assertEqual(outcome(romaniser, text), outcome(romanise, text, system, **options))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Romaniser("xx")
+        with self.assertRaises(ValueError):
+            Romaniser("rr")("가ㄱ")
+
+    def test_repr(self):
+        self.assertEqual(repr(Romaniser("ipa", cap=True)), "Romaniser('ipa')")
+
+
+if __name__ == '__main__':
+    main()
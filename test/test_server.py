@@ -0,0 +1,81 @@
+import asyncio
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import IsolatedAsyncioTestCase, TestCase, main
+
+from ko_pron import romanise
+from ko_pron.aio import AsyncRomaniser
+from ko_pron.server import RomanisationServer, LatencyStats
+
+
+async def exchange(reader, writer, method, path, document=None):
+    body = json.dumps(document).encode("utf-8") if document is not None else b""
+    writer.write("{} {} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {}\r\n\r\n".format(method, path, len(body))
+                 .encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.lower()] = value.strip()
+    return status, json.loads(await reader.readexactly(int(headers["content-length"])))
+
+
+class TestServer(IsolatedAsyncioTestCase):
+    async def test_tcp(self):
+        server = await RomanisationServer().start(port=0)
+        async with server:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            self.assertEqual(await exchange(reader, writer, "POST", "/romanise",
+                                            {"text": "있다", "system": "mr", "options": {"cap": True}}),
+                             (200, {"romanisation": "Itta"}))
+            self.assertEqual(await exchange(reader, writer, "POST", "/romanise_many",
+                                            {"texts": ["있다", "한국어"], "system": "ipa"}),
+                             (200, {"romanisations": [romanise("있다", "ipa"), romanise("한국어", "ipa")]}))
+            status, document = await exchange(reader, writer, "POST", "/romanise", {"text": "가ㄱ"})
+            self.assertEqual((status, document["error"]), (400, "ValueError: No boundary data for ㄱ-Ø."))
+            self.assertEqual((await exchange(reader, writer, "POST", "/romanise", {"text": 1}))[0], 400)
+            self.assertEqual((await exchange(reader, writer, "GET", "/romanise"))[0], 405)
+            self.assertEqual((await exchange(reader, writer, "GET", "/other"))[0], 404)
+            status, stats = await exchange(reader, writer, "GET", "/stats")
+            self.assertEqual(status, 200)
+            self.assertEqual(stats["endpoints"]["/romanise"]["requests"], 3)
+            self.assertEqual(stats["endpoints"]["/romanise"]["errors"], 2)
+            self.assertLessEqual(stats["endpoints"]["/romanise"]["p50_ms"], stats["endpoints"]["/romanise"]["p99_ms"])
+            writer.close()
+
+    async def test_internal_error(self):
+        executor = ThreadPoolExecutor(1)
+        executor.shutdown()
+        server = RomanisationServer(AsyncRomaniser(executor))
+        status, document = await server.handle("POST", "/romanise", b'{"text": "\xec\x9e\x88\xeb\x8b\xa4"}')
+        self.assertEqual((status, document["error"].split(":")[0]), (500, "RuntimeError"))
+        self.assertEqual(server.stats.snapshot()["/romanise"]["errors"], 1)
+
+    async def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ko_pron.sock")
+            server = await RomanisationServer().start(path=path)
+            async with server:
+                reader, writer = await asyncio.open_unix_connection(path)
+                self.assertEqual(await exchange(reader, writer, "POST", "/romanise", {"text": "있다"}),
+                                 (200, {"romanisation": "itda"}))
+                writer.close()
+
+
+class TestLatencyStats(TestCase):
+    def test_percentiles(self):
+        stats = LatencyStats(window=100)
+        for milliseconds in range(1, 201):
+            stats.record("/romanise", milliseconds / 1000, milliseconds % 50 == 0)
+        self.assertEqual(stats.snapshot(), {"/romanise": {"requests": 200, "errors": 4, "p50_ms": 150.0,
+                                                          "p90_ms": 190.0, "p99_ms": 199.0}})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+from unittest import TestCase, main
+
+from benchmark.startup import import_profile
+from ko_pron import tables
+from ko_pron.transducer import Transducer
+
+
+class TestStartup(TestCase):
+    # The import time budget depends on the machine and is checked by benchmark.startup
+    def test_heavy_modules_are_imported_on_use(self):
+        with tempfile.TemporaryDirectory() as cache_prefix:
+            imported = import_profile("import ko_pron", cache_prefix)
+        for name in ["multiprocessing", "concurrent.futures", "ko_pron.transducer", "asyncio"]:
+            self.assertNotIn(name, imported)
+
+
+class TestTableCache(TestCase):
+    def tearDown(self):
+        tables.set_table_cache(None)
+
+    def test_cached_table(self):
+        built = []
+
+        def build():
+            built.append(1)
+            return ("a", b"b", (1, 2))
+
+        with tempfile.TemporaryDirectory() as directory:
+            tables.set_table_cache(directory)
+            self.assertEqual(tables.cached_table("test", build), ("a", b"b", (1, 2)))
+            self.assertEqual(tables.cached_table("test", build), ("a", b"b", (1, 2)))
+            self.assertEqual(len(built), 1)
+            for name in os.listdir(directory):
+                with open(os.path.join(directory, name), "wb") as output:
+                    output.write(b"\x00")
+            self.assertEqual(tables.cached_table("test", build), ("a", b"b", (1, 2)))
+            self.assertEqual(len(built), 2)
+
+    def test_unwritable_cache(self):
+        with tempfile.NamedTemporaryFile() as not_a_directory:
+            tables.set_table_cache(not_a_directory.name)
+            self.assertEqual(tables.cached_table("test", lambda: (1,)), (1,))
+
+    def test_transducer_tables(self):
+        compiled = Transducer(1)
+        with tempfile.TemporaryDirectory() as directory:
+            tables.set_table_cache(directory)
+            Transducer(1)
+            loaded = Transducer(1)
+        self.assertEqual((loaded.vowels, loaded.junctions), (compiled.vowels, compiled.junctions))
+
+
+if __name__ == '__main__':
+    main()
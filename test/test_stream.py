@@ -0,0 +1,90 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stderr
+from unittest import TestCase, main
+
+from ko_pron.__main__ import main as cli
+from ko_pron.stream import romanise_stream, romanise_file
+
+
+class TestRomaniseStream(TestCase):
+    def test_text_keeps_non_hangul(self):
+        lines = ["한국어 is 좋다\n", "abc, 123\n", "\n", "있다"]
+        self.assertEqual(list(romanise_stream(lines, "mr")),
+                         ["han'gugŏ is chot'a\n", "abc, 123\n", "\n", "itta"])
+
+    def test_lazy(self):
+        lines = iter(["있다\n", "한국어\n"])
+        stream = romanise_stream(lines, "rr")
+        self.assertEqual(next(stream), "itda\n")
+        self.assertEqual(next(lines), "한국어\n")
+
+    def test_tsv(self):
+        self.assertEqual(list(romanise_stream(["1\t있다\r\n", "2\n"], "rr", input_format="tsv", column=1)),
+                         ["1\t있다\titda\r\n", "2\t\n"])
+
+    def test_jsonl(self):
+        result = list(romanise_stream(['{"word": "있다"}\n'], "ipa", input_format="jsonl", field="word"))
+        self.assertEqual(json.loads(result[0]), {"word": "있다", "ipa": "it̚t͈a̠"})
+
+    def test_options(self):
+        self.assertEqual(list(romanise_stream(["한국어"], "rr", cap=True)), ["Han-gugeo"])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError) as raised:
+            list(romanise_stream(["있다", "가ㄱ"], "rr"))
+        self.assertEqual(raised.exception.line_number, 2)
+        self.assertEqual(list(romanise_stream(["가ㄱ 있다"], "rr", errors="keep")), ["가ㄱ 있다"])
+
+    def test_jsonl_errors(self):
+        lines = ['[1]\n', '{"text": \n', '"있다"\n']
+        for line in lines:
+            with self.subTest(line=line):
+                with self.assertRaisesRegex(ValueError, "not a JSON object"):
+                    list(romanise_stream([line], "rr", input_format="jsonl"))
+        self.assertEqual(list(romanise_stream(lines, "rr", input_format="jsonl", errors="keep")), lines)
+
+    def test_file_keeps_lines_before_an_error(self):
+        output = io.StringIO()
+        with self.assertRaises(ValueError):
+            romanise_file(io.StringIO("있다\n있다\n가ㄱ\n"), output, "mr", chunk_lines=10)
+        self.assertEqual(output.getvalue(), "itta\nitta\n")
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            list(romanise_stream([], "rr", input_format="csv"))
+
+    def test_file_chunks(self):
+        output = io.StringIO()
+        self.assertEqual(romanise_file(io.StringIO("있다\n" * 5), output, "mr", chunk_lines=2), 5)
+        self.assertEqual(output.getvalue(), "itta\n" * 5)
+
+
+class TestCommandLine(TestCase):
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source, destination = os.path.join(directory, "in.tsv"), os.path.join(directory, "out.tsv")
+            with open(source, "w", encoding="utf-8") as file:
+                file.write("있다\t1\n한국어\t2\n")
+            cli(["-s", "mr", "-f", "tsv", "-o", destination, source])
+            with open(destination, encoding="utf-8") as file:
+                self.assertEqual(file.read(), "있다\t1\titta\n한국어\t2\than'gugŏ\n")
+
+    def test_strict_error(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source, destination = os.path.join(directory, "in.txt"), os.path.join(directory, "out.txt")
+            with open(source, "w", encoding="utf-8") as file:
+                file.write("있다\n한국어\n가ㄱ\n있다\n")
+            errors = io.StringIO()
+            with redirect_stderr(errors):
+                self.assertEqual(cli(["-s", "mr", "-o", destination, source]), 1)
+            self.assertTrue(errors.getvalue().startswith(source + ": line 3: "), errors.getvalue())
+            with open(destination, encoding="utf-8") as file:
+                self.assertEqual(file.read(), "itta\nhan'gugŏ\n")
+            self.assertEqual(cli(["-s", "mr", "--errors", "keep", "-o", destination, source]), 0)
+
+
+if __name__ == '__main__':
+    main()
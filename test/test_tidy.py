@@ -0,0 +1,79 @@
+import random
+import re
+import unicodedata
+from math import floor
+from unittest import TestCase, main
+
+from ko_pron.ko_pron import tidy_ipa, tidy_phonetic, _romanise_respelling
+
+
+def sequential_tidy_ipa(ipa):
+    # tidy_ipa as a sequence of full-text replacements
+    ipa = ipa.replace("ʌ̹ː", "ɘː")
+    ipa = re.sub("ɭɭ([ji])", "ɭʎ\\1", ipa)
+    ipa = re.sub("s([͈]?)ʰɥi", "ʃ\\1ʰɥi", ipa)
+    ipa = re.sub("s([ʰ͈])([ji])", "ɕ\\1\\2", ipa)
+    ipa = ipa.replace("nj", "ɲj")
+    for key, value in [("kʰi", "kçi"), ("kʰj", "kçj"), ("kʰɯ", "kxɯ"),
+                       ("hi", "çi"), ("hj", "çj"), ("hɯ", "xɯ"), ("ho", "ɸʷo"), ("hu", "ɸʷu"), ("hw", "ɸw"),
+                       ("ɦi", "ʝi"), ("ɦj", "ʝj"), ("ɦɯ", "ɣɯ"), ("ɦo", "βo"), ("ɦu", "βu"), ("ɦw", "βw")]:
+        ipa = ipa.replace(key, value)
+    if "ɥi" in ipa:
+        midpoint = floor(len(ipa) / 2)
+        ipa = ipa[0:midpoint] + ipa[midpoint:].replace("ɥi", "y")
+    return ipa
+
+
+def stepwise_tidy_phonetic(original, romanised):
+    # tidy_phonetic walking every character of "romanised"
+    j, k, w = 0, 0, []
+    for i in range(0, len(romanised)):
+        romanised_syllable = romanised[k:k + 1]
+        original_syllable = original[j:j + 1]
+
+        w += romanised_syllable
+        if romanised_syllable != original_syllable:
+            if original_syllable not in {"", ":", " "}:
+                k = k + 1
+            if romanised_syllable not in {"", ":", " "}:
+                j = j + 1
+        else:
+            j, k = j + 1, k + 1
+    return "".join(w)
+
+
+class TestTidyPhonetic(TestCase):
+    def test_matches_stepwise_alignment(self):
+        symbols = "가나닫라:  마"
+        generator = random.Random(0)
+        for _ in range(20000):
+            original = "".join(generator.choice(symbols) for _ in range(generator.randint(0, 10)))
+            romanised = "".join(generator.choice(symbols) for _ in range(generator.randint(0, 12)))
+            self.assertEqual(tidy_phonetic(original, romanised), stepwise_tidy_phonetic(original, romanised))
+
+    def test_long_words_with_long_vowels(self):
+        generator = random.Random(1)
+        text = "".join(generator.choice("외계인 한국어 넓다 같이 의의 밟고") for _ in range(400))
+        for long_vowels in (frozenset(), frozenset(range(0, len(text), 3))):
+            phonetic = "".join(_romanise_respelling(text, (0,), long_vowels, False, frozenset(), frozenset(),
+                                                    frozenset(), None)[0])
+            phonetic = unicodedata.normalize('NFC', phonetic)
+            self.assertEqual(tidy_phonetic(text, phonetic), stepwise_tidy_phonetic(text, phonetic))
+
+
+class TestTidyIpa(TestCase):
+    def test_matches_sequential_replacements(self):
+        symbols = ["ʌ̹ː", "ʌ", "̹", "ː", "ɭ", "j", "i", "s", "͈", "ʰ", "ɥ", "n", "k", "ɯ", "h", "o", "u", "w", "ɦ",
+                   "a", " "]
+        generator = random.Random(0)
+        for _ in range(20000):
+            ipa = "".join(generator.choice(symbols) for _ in range(generator.randint(0, 12)))
+            self.assertEqual(tidy_ipa(ipa), sequential_tidy_ipa(ipa), ipa)
+
+    def test_rewrites(self):
+        self.assertEqual(tidy_ipa("sʰɥiɦo kʰitʰɯ"), "ʃʰɥiβo kçitʰɯ")
+        self.assertEqual(tidy_ipa("ɥi ɥi"), "ɥi y")
+
+
+if __name__ == '__main__':
+    main()
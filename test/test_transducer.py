@@ -0,0 +1,54 @@
+import random
+from unittest import TestCase, main
+
+from benchmark.transducer import junction_walk
+from ko_pron import romanise, set_engine
+from ko_pron.jamo import HANGUL_FIRST, HANGUL_COUNT
+from ko_pron.transducer import transducer, transduce_all
+
+
+class TestTransducer(TestCase):
+    def tearDown(self):
+        set_engine("junction")
+
+    def test_matches_junction_walk(self):
+        generator = random.Random(0)
+        special = ["넓다", "넓적", "넓이", "밟고", "밟아", "같이", "굳이", "닫히다", "핥이", "의의", "무늬", "부부"]
+        words = special + ["".join(chr(HANGUL_FIRST + generator.randrange(HANGUL_COUNT))
+                                   for _ in range(generator.randint(1, 4))) for _ in range(500)]
+        for system_index in range(6):
+            for word in words:
+                self.assertEqual(transducer(system_index).transduce(word), junction_walk(word, system_index),
+                                 (word, system_index))
+
+    def test_transduce_all(self):
+        generator = random.Random(1)
+        words = ["넓다", "넓이", "밟고", "같이 가", "'의의"] + \
+            ["".join(chr(HANGUL_FIRST + generator.randrange(HANGUL_COUNT)) for _ in range(generator.randint(1, 4)))
+             for _ in range(200)]
+        for word in words:
+            self.assertEqual(transduce_all(word, range(6)),
+                             {system_index: transducer(system_index).transduce(word) for system_index in range(6)})
+        self.assertEqual(transduce_all("가", [3, 1]), {3: "ka", 1: "ga"})
+        self.assertIsNone(transduce_all("가ㄱ", range(6)))
+
+    def test_unsupported_characters(self):
+        self.assertIsNone(transducer(1).transduce("가ㄱ"))
+        self.assertEqual(transducer(1).transduce("가 '나"), junction_walk("가 '나", 1))
+
+    def test_engine(self):
+        words = ["외계인", "넓죽하다", "같이 가요", "읽는다"]
+        options = [{}, {"ui": 1, "svar": 2}, {"nn": [2]}, {"cap": True}]
+        expected = [[romanise(word, system, **option) for option in options]
+                    for word in words for system in ["ph", "rr", "ipa", "mr"]]
+        set_engine("transducer")
+        self.assertEqual([[romanise(word, system, **option) for option in options]
+                          for word in words for system in ["ph", "rr", "ipa", "mr"]], expected)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            set_engine("fst")
+
+
+if __name__ == '__main__':
+    main()